@@ -6,19 +6,69 @@ Language-agnostic AST analysis and dependency visualization tool
 
 import ast
 import argparse
+import array
+import bisect
+import fnmatch
+import hashlib
 import json
+import mmap
 import os
 import sys
 import re
+import string
 import subprocess
-from pathlib import Path
-from typing import Dict, List, Any, Set, Tuple, Optional
+from html import escape
+from typing import Dict, List, Any, Set, Tuple, Optional, Callable, Iterator
 from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 import importlib.util
 
+import io_backend
+import parse_cache
+from parse_cache import cached_parse
 
-@dataclass
+# Optional: orjson serializes large reports several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Ordinal scores used to average complexity labels across a project
+COMPLEXITY_SCORES = {
+    "O(1)": 1,
+    "O(log n)": 2,
+    "O(n)": 3,
+    "O(n log n)": 4,
+    "O(n²)": 5,
+    "O(2^n)": 6,
+    "O(n!)": 7
+}
+SCORE_TO_COMPLEXITY = {score: label for label, score in COMPLEXITY_SCORES.items()}
+HIGH_COMPLEXITY = frozenset(["O(n²)", "O(2^n)", "O(n!)"])
+# Label for each loop nesting depth; deeper nesting is capped at the last
+LOOP_DEPTH_LABELS = ("O(1)", "O(n)", "O(n²)")
+
+# Result sections a caller needs from parse(); sections left out come back
+# as empty lists. Imports travel with dependencies, classes with functions.
+NEED_DEPS = 1
+NEED_COMPLEXITY = 2
+NEED_FUNCS = 4
+NEED_ALL = NEED_DEPS | NEED_COMPLEXITY | NEED_FUNCS
+_NEED_SECTIONS = (
+    (NEED_DEPS, ('dependencies', 'imports')),
+    (NEED_COMPLEXITY, ('complexity',)),
+    (NEED_FUNCS, ('functions', 'classes', 'structs'))
+)
+
+# Result records are created in bulk and never mutated; __slots__ drops the
+# per-instance __dict__ where dataclasses support it (Python 3.10+)
+_RECORD = {'frozen': True, 'slots': True} if sys.version_info >= (3, 10) else {'frozen': True}
+
+
+@dataclass(**_RECORD)
 class DependencyInfo:
     """Represents a dependency relationship between code components"""
     source: str
@@ -28,7 +78,7 @@ class DependencyInfo:
     column: int
 
 
-@dataclass
+@dataclass(**_RECORD)
 class ComplexityInfo:
     """Represents algorithmic complexity information for a function"""
     function: str
@@ -38,14 +88,14 @@ class ComplexityInfo:
     warning: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class CircularDependency:
     """Represents a circular dependency cycle"""
     cycle: List[str]
     severity: str  # 'warning' or 'error'
 
 
-@dataclass
+@dataclass(**_RECORD)
 class ProjectMetrics:
     """Overall project analysis metrics"""
     total_files: int
@@ -64,9 +114,96 @@ class AnalysisResult:
     metrics: ProjectMetrics
 
 
+class DependencyTable:
+    """Column-oriented store of dependency edges
+    
+    Names and dependency types are interned once and edges are kept as
+    parallel typed arrays of ids, so repeated module names cost a single
+    string however many files import them.
+    """
+    
+    def __init__(self):
+        self.names: List[str] = []
+        self.types: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._type_ids: Dict[str, int] = {}
+        self.source_ids = array.array('i')
+        self.target_ids = array.array('i')
+        self.type_ids = array.array('b')
+        self.lines = array.array('i')
+        self.columns = array.array('i')
+    
+    def intern(self, name: str) -> int:
+        """Return the id of name, assigning one on first use"""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+    
+    def add(self, source: str, target: str, type: str, line: int, column: int):
+        """Append one dependency edge"""
+        type_id = self._type_ids.get(type)
+        if type_id is None:
+            type_id = self._type_ids[type] = len(self.types)
+            self.types.append(type)
+        
+        self.source_ids.append(self.intern(source))
+        self.target_ids.append(self.intern(target))
+        self.type_ids.append(type_id)
+        self.lines.append(line)
+        self.columns.append(column)
+    
+    def edges(self) -> Set[Tuple[int, int]]:
+        """Distinct (source_id, target_id) pairs"""
+        return set(zip(self.source_ids, self.target_ids))
+    
+    def __len__(self) -> int:
+        return len(self.source_ids)
+    
+    def __iter__(self):
+        """Yield each edge as a DependencyInfo"""
+        names = self.names
+        types = self.types
+        for source_id, target_id, type_id, line, column in zip(
+            self.source_ids, self.target_ids, self.type_ids, self.lines, self.columns
+        ):
+            yield DependencyInfo(names[source_id], names[target_id], types[type_id], line, column)
+
+
+_NEWLINE_RE = re.compile(b'\n')
+
+# Tokens that matter when balancing braces in C-like sources: comments and
+# string literals are matched whole so braces inside them are skipped, and
+# empty pairs such as Go's interface{} never open a block
+_BRACE_TOKEN_RE = re.compile(
+    rb'//[^\n]*'
+    rb'|/\*.*?(?:\*/|\Z)'
+    rb"|'(?:\\.|[^'\\\n])*'"
+    rb'|"(?:\\.|[^"\\\n])*"'
+    rb'|`(?:\\.|[^`\\])*`'
+    rb'|\{[ \t]*\}'
+    rb'|[{}()\n;]',
+    re.DOTALL
+)
+
+
+# Field names of the 'dep' and 'cx' rows, after the tag, for parse's dicts
+_DEP_FIELDS = ('source', 'target', 'type', 'line', 'column')
+_CX_FIELDS = ('function', 'file', 'complexity', 'line', 'warning')
+
+
+# Files above this size are memory-mapped by parsers that set _use_mmap,
+# so their regexes scan the page cache directly instead of a copy
+_MMAP_MIN_SIZE = 65536
+
+
 class BaseParser:
     """Base class for language-specific parsers"""
     
+    # Whether _parse_source can take an mmap in place of bytes
+    _use_mmap = False
+    
     def __init__(self, file_extensions: List[str]):
         self.file_extensions = file_extensions
     
@@ -74,9 +211,136 @@ class BaseParser:
         """Check if this parser can handle the given file"""
         return any(file_path.endswith(ext) for ext in self.file_extensions)
     
-    def parse(self, file_path: str) -> Dict[str, Any]:
-        """Parse a file and extract analysis data"""
-        raise NotImplementedError("Subclasses must implement parse method")
+    def parse(self, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
+        """Parse a file and extract the analysis data selected by need"""
+        result = self._parse_rows(file_path, need)
+        return dict(
+            result,
+            dependencies=[dict(zip(_DEP_FIELDS, row[1:])) for row in result['dependencies']],
+            complexity=[dict(zip(_CX_FIELDS, row[1:])) for row in result['complexity']]
+        )
+    
+    def _parse_rows(self, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
+        """Parse a file into dependency and complexity rows as parse_iter yields them"""
+        raise NotImplementedError("Subclasses must implement _parse_rows method")
+    
+    def _parse_file(self, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
+        """Run _parse_source on a file, skipping the read if the cache has it unchanged"""
+        result = parse_cache.lookup(file_path)
+        if result is None:
+            # need is only passed when narrowed, so that partial results are
+            # never stored in the parse cache
+            args = (file_path,) if need == NEED_ALL else (file_path, need)
+            with open(file_path, 'rb') as f:
+                if self._use_mmap and os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                        result = self._parse_source(source, *args)
+                else:
+                    result = self._parse_source(f.read(), *args)
+        
+        if need != NEED_ALL:
+            # A stored full result may satisfy a narrowed call; drop the
+            # sections that weren't asked for so the cache can't change output
+            result = dict(result)
+            for flag, sections in _NEED_SECTIONS:
+                if not need & flag:
+                    for section in sections:
+                        if section in result:
+                            result[section] = []
+        return result
+    
+    def parse_iter(self, file_path: str, need: int = NEED_ALL):
+        """Parse a file and yield its analysis data as tagged tuples
+        
+        Yields ('dep', source, target, type, line, column) per dependency,
+        ('cx', function, file, complexity, line, warning) per analysed
+        function and ('fn', name) per function name.
+        """
+        result = self._parse_rows(file_path, need)
+        yield from result['dependencies']
+        yield from result['complexity']
+        for name in result['functions']:
+            yield ('fn', name)
+    
+    def _decode(self, raw: bytes) -> str:
+        """Decode a matched fragment of source bytes"""
+        return raw.decode('utf-8', 'replace')
+    
+    def _newline_offsets(self, content: bytes) -> array.array:
+        """Offsets of every newline in content, preceded by a -1 sentinel
+        
+        Computed once per file; entry i is the offset just before line i + 1.
+        """
+        offsets = array.array('q', [-1])
+        offsets.extend(match.start() for match in _NEWLINE_RE.finditer(content))
+        return offsets
+    
+    def _position(self, newlines: array.array, offset: int) -> Tuple[int, int]:
+        """Convert an absolute offset into a 1-based line and 0-based column"""
+        line = bisect.bisect_left(newlines, offset)
+        return line, offset - newlines[line - 1] - 1
+    
+    def _brace_balance_end(self, content: bytes, start: int) -> int:
+        """Return the offset just past the block opened after start
+        
+        Braces inside comments, string literals or the parameter list are
+        ignored. If the statement ends (newline or ';' outside parentheses)
+        before a block opens, the offset of that terminator is returned.
+        """
+        depth = 0
+        parens = 0
+        for token in _BRACE_TOKEN_RE.finditer(content, start):
+            char = token.group()
+            if char == b'{':
+                if depth or parens <= 0:
+                    depth += 1
+            elif char == b'}':
+                if depth:
+                    depth -= 1
+                    if depth == 0:
+                        return token.end()
+            elif depth == 0:
+                if char == b'(':
+                    parens += 1
+                elif char == b')':
+                    parens -= 1
+                elif (char == b'\n' or char == b';') and parens <= 0:
+                    return token.start()
+        return len(content)
+    
+    def _function_block(self, content: bytes, newlines: array.array, start: int) -> bytes:
+        """Return a function's source from the start of its first line"""
+        line, _ = self._position(newlines, start)
+        return content[newlines[line - 1] + 1:self._brace_balance_end(content, start)]
+
+
+# AST fields holding statement lists; imports, functions and classes are
+# statements, so they can only ever be found by descending through these
+_BLOCK_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+# Node kinds the Python parser acts on, keyed by exact node type so the
+# hot loops do one dict lookup instead of a chain of isinstance calls
+_TAG_IMPORT, _TAG_IMPORT_FROM, _TAG_FUNCTION, _TAG_CLASS, _TAG_LOOP, _TAG_CALL = range(6)
+_NODE_TAGS = {
+    ast.Import: _TAG_IMPORT,
+    ast.ImportFrom: _TAG_IMPORT_FROM,
+    ast.FunctionDef: _TAG_FUNCTION,
+    ast.AsyncFunctionDef: _TAG_FUNCTION,
+    ast.ClassDef: _TAG_CLASS,
+    ast.For: _TAG_LOOP,
+    ast.AsyncFor: _TAG_LOOP,
+    ast.While: _TAG_LOOP,
+    ast.Call: _TAG_CALL
+}
+
+
+# Expression contexts and operators have no children worth visiting
+_LEAF_NODES = (ast.expr_context, ast.operator, ast.unaryop, ast.boolop, ast.cmpop)
+
+
+# Path-independent summaries kept per PythonParser, keyed by a digest of
+# the source; entries hold names and numbers only, never the tree
+_SUMMARY_CACHE_SIZE = 128
 
 
 class PythonParser(BaseParser):
@@ -84,26 +348,13 @@ class PythonParser(BaseParser):
     
     def __init__(self):
         super().__init__(['.py'])
+        # Recent source summaries in least- to most-recently-used order
+        self._summary_cache: Dict[bytes, Dict[str, Any]] = {}
     
-    def parse(self, file_path: str) -> Dict[str, Any]:
+    def _parse_rows(self, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
         """Parse Python file using AST"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content, filename=file_path)
-            
-            dependencies = self._extract_dependencies(tree, file_path)
-            complexity = self._analyze_complexity(tree, file_path)
-            functions = self._extract_functions(tree)
-            
-            return {
-                'dependencies': dependencies,
-                'complexity': complexity,
-                'functions': functions,
-                'imports': self._extract_imports(tree),
-                'classes': self._extract_classes(tree)
-            }
+            return self._parse_file(file_path, need)
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             return {
@@ -114,141 +365,196 @@ class PythonParser(BaseParser):
                 'classes': []
             }
     
-    def _extract_dependencies(self, tree: ast.AST, file_path: str) -> List[Dict[str, Any]]:
-        """Extract import dependencies from AST"""
-        dependencies = []
+    @cached_parse
+    def _parse_source(self, source: bytes, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
+        """Analyze Python source; ast.parse decodes it per PEP 263"""
+        need_complexity = need & NEED_COMPLEXITY
+        summary = self._summarize(source, file_path, need_complexity)
+        need_deps = need & NEED_DEPS
+        need_funcs = need & NEED_FUNCS
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
+        return {
+            'dependencies': self._extract_dependencies(summary['deps'], file_path) if need_deps else [],
+            'complexity': self._analyze_complexity(summary['complexity'], file_path) if need_complexity else [],
+            'functions': list(summary['functions']) if need_funcs else [],
+            'imports': list(summary['imports']) if need_deps else [],
+            'classes': list(summary['classes']) if need_funcs else []
+        }
+    
+    def _summarize(self, source: bytes, file_path: str, need_complexity: int) -> Dict[str, Any]:
+        """Return the path-independent facts of source, reusing an identical recent source
+        
+        The tree is dropped once summarized, so the cache costs little more
+        than the names it records; they are kept as tuples so that callers
+        can't alter a shared entry. Complexity labels are left as None
+        unless asked for, and a later request for them parses again.
+        """
+        digest = hashlib.blake2b(source, digest_size=16).digest()
+        cache = self._summary_cache
+        summary = cache.pop(digest, None)
+        if summary is None or (need_complexity and summary['complexity'] is None):
+            # type_comments=False is ast.parse's default, spelled out because
+            # type comments are never inspected
+            tree = ast.parse(source, filename=file_path, type_comments=False)
+            walk = self._walk_once(tree)
+            summary = {
+                'deps': tuple(walk['deps']),
+                'imports': tuple(walk['imports']),
+                'functions': tuple(walk['functions']),
+                'classes': tuple(walk['classes']),
+                'complexity': tuple(
+                    (node.name, self._estimate_complexity(node), node.lineno)
+                    for node in walk['func_nodes']
+                ) if need_complexity else None
+            }
+            if len(cache) >= _SUMMARY_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[digest] = summary
+        return summary
+    
+    def _walk_once(self, tree: ast.AST) -> Dict[str, List[Any]]:
+        """Collect imports, functions, classes and dependencies in one AST pass"""
+        imports = []
+        functions = []
+        classes = []
+        func_nodes = []
+        deps = []  # (target, line, column)
+        
+        tag_of = _NODE_TAGS.get
+        for node in self._iter_statements(tree):
+            tag = tag_of(type(node))
+            if tag is None:
+                continue
+            if tag == _TAG_IMPORT:
                 for alias in node.names:
-                    dependencies.append({
-                        'source': file_path,
-                        'target': alias.name,
-                        'type': 'import',
-                        'line': node.lineno,
-                        'column': node.col_offset
-                    })
-            elif isinstance(node, ast.ImportFrom):
+                    imports.append(alias.name)
+                    deps.append((alias.name, node.lineno, node.col_offset))
+            elif tag == _TAG_IMPORT_FROM:
                 if node.module:
+                    imports.append(node.module)
                     for alias in node.names:
-                        dependencies.append({
-                            'source': file_path,
-                            'target': f"{node.module}.{alias.name}",
-                            'type': 'import',
-                            'line': node.lineno,
-                            'column': node.col_offset
-                        })
+                        deps.append((f"{node.module}.{alias.name}", node.lineno, node.col_offset))
+            elif tag == _TAG_FUNCTION:
+                functions.append(node.name)
+                func_nodes.append(node)
+            elif tag == _TAG_CLASS:
+                classes.append(node.name)
         
-        return dependencies
+        return {
+            'imports': imports,
+            'functions': functions,
+            'classes': classes,
+            'func_nodes': func_nodes,
+            'deps': deps
+        }
     
-    def _analyze_complexity(self, tree: ast.AST, file_path: str) -> List[Dict[str, Any]]:
-        """Analyze algorithmic complexity of functions"""
+    def _iter_statements(self, tree: ast.AST):
+        """Yield statement nodes breadth-first without entering expressions"""
+        queue = deque([tree])
+        while queue:
+            node = queue.popleft()
+            yield node
+            for field in _BLOCK_FIELDS:
+                block = getattr(node, field, None)
+                if isinstance(block, list):
+                    queue.extend(block)
+    
+    def _extract_dependencies(self, deps: List[Tuple[str, int, int]], file_path: str) -> List[Tuple[Any, ...]]:
+        """Build 'dep' rows from (target, line, column) tuples"""
+        return [('dep', file_path, target, 'import', line, column) for target, line, column in deps]
+    
+    def _analyze_complexity(self, functions: List[Tuple[str, str, int]], file_path: str) -> List[Tuple[Any, ...]]:
+        """Build 'cx' rows from (name, complexity, line) tuples"""
         complexity_info = []
         
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                complexity = self._estimate_complexity(node)
-                warning = None
-                
-                if self._is_high_complexity(complexity):
-                    warning = f"Consider optimizing - complexity is {complexity}"
-                
-                complexity_info.append({
-                    'function': node.name,
-                    'file': file_path,
-                    'complexity': complexity,
-                    'line': node.lineno,
-                    'warning': warning
-                })
+        for name, complexity, line in functions:
+            warning = None
+            
+            if self._is_high_complexity(complexity):
+                warning = f"Consider optimizing - complexity is {complexity}"
+            
+            complexity_info.append(('cx', name, file_path, complexity, line, warning))
         
         return complexity_info
     
     def _estimate_complexity(self, func_node: ast.AST) -> str:
         """Estimate algorithmic complexity based on AST patterns"""
-        # Simple heuristic-based complexity estimation
-        loops = 0
-        nested_loops = 0
+        # Simple heuristic-based complexity estimation, computed in a single
+        # DFS that tracks loop nesting depth instead of re-walking each loop
+        max_depth = 0
         recursive_calls = 0
+        func_name = func_node.name
         
-        for node in ast.walk(func_node):
-            if isinstance(node, (ast.For, ast.While)):
-                loops += 1
-                # Check for nested loops
-                for child in ast.walk(node):
-                    if child != node and isinstance(child, (ast.For, ast.While)):
-                        nested_loops += 1
-            elif isinstance(node, ast.Call):
-                if hasattr(node.func, 'id') and isinstance(func_node, ast.FunctionDef):
-                    if node.func.id == func_node.name:
-                        recursive_calls += 1
+        # Hot names bound to locals; children are read straight off _fields
+        # rather than through the ast.iter_child_nodes generator
+        tag_of = _NODE_TAGS.get
+        ast_node = ast.AST
+        name_node = ast.Name
+        stack = [(func_node, 0)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, depth = pop()
+            tag = tag_of(type(node))
+            if tag == _TAG_LOOP:
+                depth += 1
+                if depth > max_depth:
+                    max_depth = depth
+            elif tag == _TAG_CALL:
+                if type(node.func) is name_node and node.func.id == func_name:
+                    recursive_calls += 1
+            
+            for field in node._fields:
+                value = getattr(node, field, None)
+                if type(value) is list:
+                    for child in value:
+                        if isinstance(child, ast_node):
+                            push((child, depth))
+                elif isinstance(value, ast_node) and not isinstance(value, _LEAF_NODES):
+                    push((value, depth))
         
         # Complexity estimation logic
         if recursive_calls > 0:
             return "O(2^n)"  # Assume exponential for recursive without memoization
-        elif nested_loops > 0:
-            return "O(n²)"
-        elif loops > 0:
-            return "O(n)"
-        else:
-            return "O(1)"
+        return LOOP_DEPTH_LABELS[min(max_depth, len(LOOP_DEPTH_LABELS) - 1)]
     
     def _is_high_complexity(self, complexity: str) -> bool:
         """Check if complexity is considered high"""
-        high_complexity = ["O(n²)", "O(2^n)", "O(n!)"]
-        return complexity in high_complexity
-    
-    def _extract_functions(self, tree: ast.AST) -> List[str]:
-        """Extract function names from AST"""
-        functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                functions.append(node.name)
-        return functions
-    
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """Extract import statements"""
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
-        return imports
-    
-    def _extract_classes(self, tree: ast.AST) -> List[str]:
-        """Extract class names from AST"""
-        classes = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                classes.append(node.name)
-        return classes
+        return complexity in HIGH_COMPLEXITY
+
+
+# One alternation per concern so each file is scanned once; the named
+# group that matched identifies the syntax form. On bytes \w is ASCII
+# only, so names also take any UTF-8 lead or continuation byte
+_JS_IMPORT_RE = re.compile(
+    rb'import\s+.*\s+from\s+[\'"](?P<from>[^\'"]+)[\'"]'
+    rb'|import\s*\(\s*[\'"](?P<dynamic>[^\'"]+)[\'"]\s*\)'
+    rb'|import\s+[\'"](?P<bare>[^\'"]+)[\'"]'
+    rb'|require\s*\(\s*[\'"](?P<require>[^\'"]+)[\'"]\s*\)'
+)
+_JS_FUNC_RE = re.compile(
+    rb'function\s+(?P<declaration>[\w\x80-\xff]+)\s*\('
+    rb'|(?P<method>[\w\x80-\xff]+)\s*:\s*function\s*\('
+    rb'|(?P<expression>[\w\x80-\xff]+)\s*=\s*function\s*\('
+    rb'|const\s+(?P<const_arrow>[\w\x80-\xff]+)\s*=\s*\([^)]*\)\s*=>'
+    rb'|(?P<arrow>[\w\x80-\xff]+)\s*=\s*\([^)]*\)\s*=>\s*{'
+)
+_JS_CLASS_RE = re.compile(rb'class\s+([\w\x80-\xff]+)(?:\s+extends\s+[\w\x80-\xff]+)?')
+_JS_LOOP_RE = re.compile(rb'\b(for|while|forEach)\b')
 
 
 class JavaScriptParser(BaseParser):
     """JavaScript/TypeScript parser using regex patterns"""
     
+    _use_mmap = True
+    
     def __init__(self):
         super().__init__(['.js', '.ts', '.jsx', '.tsx'])
     
-    def parse(self, file_path: str) -> Dict[str, Any]:
+    def _parse_rows(self, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
         """Parse JavaScript/TypeScript file using regex patterns"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            dependencies = self._extract_dependencies(content, file_path)
-            complexity = self._analyze_complexity(content, file_path)
-            functions = self._extract_functions(content)
-            
-            return {
-                'dependencies': dependencies,
-                'complexity': complexity,
-                'functions': functions,
-                'imports': self._extract_imports(content),
-                'classes': self._extract_classes(content)
-            }
+            return self._parse_file(file_path, need)
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             return {
@@ -259,37 +565,57 @@ class JavaScriptParser(BaseParser):
                 'classes': []
             }
     
-    def _extract_dependencies(self, content: str, file_path: str) -> List[Dict[str, Any]]:
-        """Extract import/require dependencies using regex"""
-        dependencies = []
-        lines = content.split('\n')
-        
-        # Match import statements
-        import_patterns = [
-            r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]',
-            r'import\s+[\'"]([^\'"]+)[\'"]',
-            r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-            r'import\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)'
+    @cached_parse
+    def _parse_source(self, content: bytes, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
+        """Analyze JavaScript/TypeScript source bytes; matches are decoded only when emitted"""
+        newlines = self._newline_offsets(content)
+        dependencies, imports, complexity, functions, classes = [], [], [], [], []
+        
+        if need & NEED_DEPS:
+            # One import scan feeds both the dependency list and the import names
+            imports_with_offsets = self._scan_imports(content)
+            dependencies = self._extract_dependencies(imports_with_offsets, newlines, file_path)
+            imports = [target for kind, target, _ in imports_with_offsets if kind != 'dynamic']
+        if need & NEED_COMPLEXITY:
+            # One function scan feeds both the complexity list and the names
+            functions_with_lines = self._extract_functions_with_lines(content, newlines)
+            complexity = self._analyze_complexity(functions_with_lines, file_path)
+            if need & NEED_FUNCS:
+                functions = [func_name for func_name, _, _ in functions_with_lines]
+        elif need & NEED_FUNCS:
+            functions = self._extract_functions(content)
+        if need & NEED_FUNCS:
+            classes = self._extract_classes(content)
+        
+        return {
+            'dependencies': dependencies,
+            'complexity': complexity,
+            'functions': functions,
+            'imports': imports,
+            'classes': classes
+        }
+    
+    def _scan_imports(self, content: bytes) -> List[Tuple[str, str, int]]:
+        """Return (syntax form, module, offset) for every import/require"""
+        return [
+            (match.lastgroup, self._decode(match.group(match.lastgroup)), match.start())
+            for match in _JS_IMPORT_RE.finditer(content)
         ]
+    
+    def _extract_dependencies(self, imports: List[Tuple[str, str, int]], newlines: array.array,
+                              file_path: str) -> List[Tuple[Any, ...]]:
+        """Extract import/require dependencies from scanned imports"""
+        dependencies = []
         
-        for line_num, line in enumerate(lines, 1):
-            for pattern in import_patterns:
-                matches = re.finditer(pattern, line)
-                for match in matches:
-                    dependencies.append({
-                        'source': file_path,
-                        'target': match.group(1),
-                        'type': 'import',
-                        'line': line_num,
-                        'column': match.start()
-                    })
+        for _, target, offset in imports:
+            line_num, column = self._position(newlines, offset)
+            dependencies.append(('dep', file_path, target, 'import', line_num, column))
         
         return dependencies
     
-    def _analyze_complexity(self, content: str, file_path: str) -> List[Dict[str, Any]]:
+    def _analyze_complexity(self, functions: List[Tuple[str, int, bytes]], file_path: str) -> List[Tuple[Any, ...]]:
         """Analyze function complexity using regex patterns"""
         complexity_info = []
-        functions = self._extract_functions_with_lines(content)
         
         for func_name, line_num, func_content in functions:
             complexity = self._estimate_js_complexity(func_content)
@@ -298,154 +624,88 @@ class JavaScriptParser(BaseParser):
             if self._is_high_complexity(complexity):
                 warning = f"Consider optimizing - complexity is {complexity}"
             
-            complexity_info.append({
-                'function': func_name,
-                'file': file_path,
-                'complexity': complexity,
-                'line': line_num,
-                'warning': warning
-            })
+            complexity_info.append(('cx', func_name, file_path, complexity, line_num, warning))
         
         return complexity_info
     
-    def _extract_functions_with_lines(self, content: str) -> List[Tuple[str, int, str]]:
+    def _extract_functions_with_lines(self, content: bytes, newlines: array.array) -> List[Tuple[str, int, bytes]]:
         """Extract functions with their line numbers and content"""
         functions = []
-        lines = content.split('\n')
-        
-        # Function patterns
-        patterns = [
-            r'function\s+(\w+)\s*\(',
-            r'(\w+)\s*:\s*function\s*\(',
-            r'(\w+)\s*=\s*function\s*\(',
-            r'(\w+)\s*=\s*\([^)]*\)\s*=>\s*{',
-            r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>'
-        ]
         
-        for line_num, line in enumerate(lines, 1):
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    func_name = match.group(1)
-                    # Extract function content (simplified)
-                    func_content = self._extract_function_body(lines, line_num - 1)
-                    functions.append((func_name, line_num, func_content))
+        for match in _JS_FUNC_RE.finditer(content):
+            func_name = self._decode(match.group(match.lastgroup))
+            line_num, _ = self._position(newlines, match.start())
+            # Extract function content (simplified)
+            func_content = self._extract_function_body(content, newlines, match.start())
+            functions.append((func_name, line_num, func_content))
         
         return functions
     
-    def _extract_function_body(self, lines: List[str], start_line: int) -> str:
-        """Extract function body content (simplified)"""
-        if start_line >= len(lines):
-            return ""
-        
-        # Simple brace counting to find function end
-        brace_count = 0
-        function_lines = []
-        
-        for i in range(start_line, min(len(lines), start_line + 50)):  # Limit search
-            line = lines[i]
-            function_lines.append(line)
-            
-            brace_count += line.count('{') - line.count('}')
-            if i > start_line and brace_count <= 0:
-                break
-        
-        return '\n'.join(function_lines)
+    def _extract_function_body(self, content: bytes, newlines: array.array, start: int) -> bytes:
+        """Extract function body content"""
+        return self._function_block(content, newlines, start)
     
-    def _estimate_js_complexity(self, func_content: str) -> str:
+    def _estimate_js_complexity(self, func_content: bytes) -> str:
         """Estimate JavaScript function complexity"""
-        loops = len(re.findall(r'\b(for|while|forEach)\b', func_content))
+        loops = len(_JS_LOOP_RE.findall(func_content))
         nested_loops = 0
         
         # Simple nested loop detection
-        lines = func_content.split('\n')
+        lines = func_content.split(b'\n')
         in_loop = False
         for line in lines:
-            if re.search(r'\b(for|while|forEach)\b', line):
+            if _JS_LOOP_RE.search(line):
                 if in_loop:
                     nested_loops += 1
                 in_loop = True
-            elif '}' in line:
+            elif b'}' in line:
                 in_loop = False
         
-        if nested_loops > 0:
-            return "O(n²)"
-        elif loops > 0:
-            return "O(n)"
-        else:
-            return "O(1)"
+        # Any nested loop implies a loop, so this is the depth capped at two
+        return LOOP_DEPTH_LABELS[(loops > 0) + (nested_loops > 0)]
     
     def _is_high_complexity(self, complexity: str) -> bool:
         """Check if complexity is considered high"""
-        return complexity in ["O(n²)", "O(2^n)", "O(n!)"]
+        return complexity in HIGH_COMPLEXITY
     
-    def _extract_functions(self, content: str) -> List[str]:
-        """Extract function names"""
-        functions = []
-        patterns = [
-            r'function\s+(\w+)\s*\(',
-            r'(\w+)\s*:\s*function\s*\(',
-            r'(\w+)\s*=\s*function\s*\(',
-            r'(\w+)\s*=\s*\([^)]*\)\s*=>\s*{',
-            r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                functions.append(match.group(1))
-        
-        return functions
+    def _extract_functions(self, content: bytes) -> List[str]:
+        """Extract function names without locating their bodies"""
+        return [self._decode(match.group(match.lastgroup)) for match in _JS_FUNC_RE.finditer(content)]
     
-    def _extract_imports(self, content: str) -> List[str]:
+    def _extract_imports(self, content: bytes) -> List[str]:
         """Extract import statements"""
-        imports = []
-        patterns = [
-            r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]',
-            r'import\s+[\'"]([^\'"]+)[\'"]',
-            r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                imports.append(match.group(1))
-        
-        return imports
+        return [target for kind, target, _ in self._scan_imports(content) if kind != 'dynamic']
     
-    def _extract_classes(self, content: str) -> List[str]:
+    def _extract_classes(self, content: bytes) -> List[str]:
         """Extract class names"""
-        classes = []
-        pattern = r'class\s+(\w+)(?:\s+extends\s+\w+)?'
-        matches = re.finditer(pattern, content)
-        for match in matches:
-            classes.append(match.group(1))
-        return classes
+        return [self._decode(match.group(1)) for match in _JS_CLASS_RE.finditer(content)]
+
+
+# A parenthesised import block is matched whole and its quoted paths are
+# scanned in place; single-line imports match directly
+_GO_IMPORT_RE = re.compile(
+    rb'import\s*\((?P<block>[^)]*)\)'
+    rb'|import\s+"(?P<single>[^"]+)"'
+)
+_GO_IMPORT_PATH_RE = re.compile(rb'"([^"]+)"')
+_GO_FUNC_RE = re.compile(rb'func\s+(?:\([^)]*\)\s+)?([\w\x80-\xff]+)\s*\([^)]*\)')
+_GO_STRUCT_RE = re.compile(rb'type\s+([\w\x80-\xff]+)\s+struct')
+_GO_LOOP_RE = re.compile(rb'\b(for|range)\b')
+_GO_FOR_RE = re.compile(rb'\bfor\b')
 
 
 class GoParser(BaseParser):
     """Go parser using regex patterns"""
     
+    _use_mmap = True
+    
     def __init__(self):
         super().__init__(['.go'])
     
-    def parse(self, file_path: str) -> Dict[str, Any]:
+    def _parse_rows(self, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
         """Parse Go file using regex patterns"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            dependencies = self._extract_dependencies(content, file_path)
-            complexity = self._analyze_complexity(content, file_path)
-            functions = self._extract_functions(content)
-            
-            return {
-                'dependencies': dependencies,
-                'complexity': complexity,
-                'functions': functions,
-                'imports': self._extract_imports(content),
-                'structs': self._extract_structs(content)
-            }
+            return self._parse_file(file_path, need)
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             return {
@@ -456,55 +716,62 @@ class GoParser(BaseParser):
                 'structs': []
             }
     
-    def _extract_dependencies(self, content: str, file_path: str) -> List[Dict[str, Any]]:
-        """Extract import dependencies"""
-        dependencies = []
-        lines = content.split('\n')
+    @cached_parse
+    def _parse_source(self, content: bytes, file_path: str, need: int = NEED_ALL) -> Dict[str, Any]:
+        """Analyze Go source bytes; matches are decoded only when emitted"""
+        newlines = self._newline_offsets(content)
+        dependencies, imports, complexity, functions, structs = [], [], [], [], []
         
-        # Match import statements
-        import_patterns = [
-            r'import\s+"([^"]+)"',
-            r'import\s+\(\s*"([^"]+)"\s*\)',
-            r'^\s*"([^"]+)"\s*$'  # Inside import block
-        ]
+        if need & NEED_DEPS:
+            # One import scan feeds both the dependency list and the import names
+            imports_with_offsets = list(self._iter_imports(content))
+            dependencies = self._extract_dependencies(imports_with_offsets, newlines, file_path)
+            imports = [target for target, _ in imports_with_offsets]
+        if need & NEED_COMPLEXITY:
+            # One function scan feeds both the complexity list and the names
+            functions_with_lines = self._extract_functions_with_lines(content, newlines)
+            complexity = self._analyze_complexity(functions_with_lines, file_path)
+            if need & NEED_FUNCS:
+                functions = [func_name for func_name, _, _ in functions_with_lines]
+        elif need & NEED_FUNCS:
+            functions = self._extract_functions(content)
+        if need & NEED_FUNCS:
+            structs = self._extract_structs(content)
         
-        in_import_block = False
-        for line_num, line in enumerate(lines, 1):
-            if 'import (' in line:
-                in_import_block = True
-                continue
-            elif ')' in line and in_import_block:
-                in_import_block = False
-                continue
-            
-            if in_import_block:
-                match = re.search(r'"([^"]+)"', line)
-                if match:
-                    dependencies.append({
-                        'source': file_path,
-                        'target': match.group(1),
-                        'type': 'import',
-                        'line': line_num,
-                        'column': match.start()
-                    })
-            else:
-                for pattern in import_patterns:
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        dependencies.append({
-                            'source': file_path,
-                            'target': match.group(1),
-                            'type': 'import',
-                            'line': line_num,
-                            'column': match.start()
-                        })
+        return {
+            'dependencies': dependencies,
+            'complexity': complexity,
+            'functions': functions,
+            'imports': imports,
+            'structs': structs
+        }
+    
+    def _extract_dependencies(self, imports: List[Tuple[str, int]], newlines: array.array,
+                              file_path: str) -> List[Tuple[Any, ...]]:
+        """Extract import dependencies from scanned imports"""
+        dependencies = []
+        
+        for target, offset in imports:
+            line_num, column = self._position(newlines, offset)
+            dependencies.append(('dep', file_path, target, 'import', line_num, column))
         
         return dependencies
     
-    def _analyze_complexity(self, content: str, file_path: str) -> List[Dict[str, Any]]:
+    def _iter_imports(self, content: bytes):
+        """Yield (path, offset) for every imported package"""
+        for match in _GO_IMPORT_RE.finditer(content):
+            if match.lastgroup == 'single':
+                yield self._decode(match.group('single')), match.start()
+            else:
+                block_paths = _GO_IMPORT_PATH_RE.finditer(
+                    content, match.start('block'), match.end('block')
+                )
+                for path in block_paths:
+                    yield self._decode(path.group(1)), path.start()
+    
+    def _analyze_complexity(self, functions: List[Tuple[str, int, bytes]], file_path: str) -> List[Tuple[Any, ...]]:
         """Analyze function complexity"""
         complexity_info = []
-        functions = self._extract_functions_with_lines(content)
         
         for func_name, line_num, func_content in functions:
             complexity = self._estimate_go_complexity(func_content)
@@ -513,119 +780,178 @@ class GoParser(BaseParser):
             if self._is_high_complexity(complexity):
                 warning = f"Consider optimizing - complexity is {complexity}"
             
-            complexity_info.append({
-                'function': func_name,
-                'file': file_path,
-                'complexity': complexity,
-                'line': line_num,
-                'warning': warning
-            })
+            complexity_info.append(('cx', func_name, file_path, complexity, line_num, warning))
         
         return complexity_info
     
-    def _extract_functions_with_lines(self, content: str) -> List[Tuple[str, int, str]]:
+    def _extract_functions_with_lines(self, content: bytes, newlines: array.array) -> List[Tuple[str, int, bytes]]:
         """Extract functions with their line numbers and content"""
         functions = []
-        lines = content.split('\n')
-        
-        func_pattern = r'func\s+(?:\([^)]*\)\s+)?(\w+)\s*\([^)]*\)'
         
-        for line_num, line in enumerate(lines, 1):
-            match = re.search(func_pattern, line)
-            if match:
-                func_name = match.group(1)
-                func_content = self._extract_go_function_body(lines, line_num - 1)
-                functions.append((func_name, line_num, func_content))
+        for match in _GO_FUNC_RE.finditer(content):
+            func_name = self._decode(match.group(1))
+            line_num, _ = self._position(newlines, match.start())
+            func_content = self._extract_go_function_body(content, newlines, match.start())
+            functions.append((func_name, line_num, func_content))
         
         return functions
     
-    def _extract_go_function_body(self, lines: List[str], start_line: int) -> str:
+    def _extract_go_function_body(self, content: bytes, newlines: array.array, start: int) -> bytes:
         """Extract Go function body"""
-        if start_line >= len(lines):
-            return ""
-        
-        brace_count = 0
-        function_lines = []
-        
-        for i in range(start_line, min(len(lines), start_line + 100)):  # Limit search
-            line = lines[i]
-            function_lines.append(line)
-            
-            brace_count += line.count('{') - line.count('}')
-            if i > start_line and brace_count <= 0:
-                break
-        
-        return '\n'.join(function_lines)
+        return self._function_block(content, newlines, start)
     
-    def _estimate_go_complexity(self, func_content: str) -> str:
+    def _estimate_go_complexity(self, func_content: bytes) -> str:
         """Estimate Go function complexity"""
-        loops = len(re.findall(r'\b(for|range)\b', func_content))
+        loops = len(_GO_LOOP_RE.findall(func_content))
         nested_loops = 0
         
         # Simple nested loop detection
-        lines = func_content.split('\n')
+        lines = func_content.split(b'\n')
         in_loop = False
         for line in lines:
-            if re.search(r'\bfor\b', line):
+            if _GO_FOR_RE.search(line):
                 if in_loop:
                     nested_loops += 1
                 in_loop = True
-            elif '}' in line and in_loop:
+            elif b'}' in line and in_loop:
                 in_loop = False
         
-        if nested_loops > 0:
-            return "O(n²)"
-        elif loops > 0:
-            return "O(n)"
-        else:
-            return "O(1)"
+        # Any nested loop implies a loop, so this is the depth capped at two
+        return LOOP_DEPTH_LABELS[(loops > 0) + (nested_loops > 0)]
     
     def _is_high_complexity(self, complexity: str) -> bool:
         """Check if complexity is considered high"""
-        return complexity in ["O(n²)", "O(2^n)", "O(n!)"]
+        return complexity in HIGH_COMPLEXITY
     
-    def _extract_functions(self, content: str) -> List[str]:
-        """Extract function names"""
-        functions = []
-        pattern = r'func\s+(?:\([^)]*\)\s+)?(\w+)\s*\([^)]*\)'
-        matches = re.finditer(pattern, content)
-        for match in matches:
-            functions.append(match.group(1))
-        return functions
+    def _extract_functions(self, content: bytes) -> List[str]:
+        """Extract function names without locating their bodies"""
+        return [self._decode(match.group(1)) for match in _GO_FUNC_RE.finditer(content)]
     
-    def _extract_imports(self, content: str) -> List[str]:
+    def _extract_imports(self, content: bytes) -> List[str]:
         """Extract import statements"""
-        imports = []
-        lines = content.split('\n')
+        return [target for target, _ in self._iter_imports(content)]
+    
+    def _extract_structs(self, content: bytes) -> List[str]:
+        """Extract struct names"""
+        return [self._decode(match.group(1)) for match in _GO_STRUCT_RE.finditer(content)]
+
+
+def _extension(file_path: str) -> str:
+    """Return the lower-cased extension used as the parser lookup key"""
+    return os.path.splitext(file_path)[1].lower()
+
+
+def _parsers_by_extension(parsers: List[BaseParser]) -> Dict[str, BaseParser]:
+    """Map each file extension to the first parser that handles it"""
+    by_ext = {}
+    for parser in parsers:
+        for ext in parser.file_extensions:
+            by_ext.setdefault(ext, parser)
+    return by_ext
+
+
+# A pool worker's extension -> parser table, installed by _init_worker
+_FILE_PARSERS: Dict[str, BaseParser] = {}
+
+# Below this many files a process pool costs more to start than it saves
+_MIN_FILES_FOR_PROCESSES = 8
+
+
+def _init_worker(cache_root: Optional[str], parsers_by_ext: Dict[str, BaseParser]):
+    """Process pool initializer: open the parse cache and adopt the analyzer's parsers"""
+    global _FILE_PARSERS
+    _FILE_PARSERS = parsers_by_ext
+    parse_cache.configure(cache_root)
+
+
+def _parse_one(file_path: str, need: int = NEED_ALL,
+               parsers_by_ext: Optional[Dict[str, BaseParser]] = None) -> List[Tuple[Any, ...]]:
+    """Parse a single file into the tagged tuples of BaseParser.parse_iter
+    
+    Threads pass the analyzer's parser table; pool workers use the one
+    _init_worker installed.
+    """
+    if parsers_by_ext is None:
+        parsers_by_ext = _FILE_PARSERS
+    parser = parsers_by_ext.get(_extension(file_path))
+    if parser is None:
+        return []
+    return list(parser.parse_iter(file_path, need))
+
+
+def _tarjan_components(indptr: array.array, indices: array.array) -> Tuple[List[int], List[int], int]:
+    """Label the strongly connected components of a CSR graph
+    
+    Works purely on integer node ids so it carries no per-name overhead.
+    Returns (component, discovered, count): component[node] is the id of
+    node's SCC, numbered in the order the SCCs complete, or -1 for nodes
+    never reached; discovered lists reached nodes in visiting order. Only
+    nodes with outgoing edges are used as search roots.
+    """
+    node_count = len(indptr) - 1
+    index_of = [-1] * node_count
+    lowlink = [0] * node_count
+    component = [-1] * node_count
+    discovered = []
+    on_stack = bytearray(node_count)
+    scc_stack = []
+    # Parallel work stacks: node being explored and its next edge slot
+    work_nodes = []
+    work_edges = []
+    counter = 0
+    component_count = 0
+    
+    for root in range(node_count):
+        # Nodes without dependencies can't start a cycle
+        if index_of[root] != -1 or indptr[root] == indptr[root + 1]:
+            continue
         
-        in_import_block = False
-        for line in lines:
-            if 'import (' in line:
-                in_import_block = True
-                continue
-            elif ')' in line and in_import_block:
-                in_import_block = False
-                continue
-            
-            if in_import_block:
-                match = re.search(r'"([^"]+)"', line)
-                if match:
-                    imports.append(match.group(1))
-            else:
-                match = re.search(r'import\s+"([^"]+)"', line)
-                if match:
-                    imports.append(match.group(1))
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        discovered.append(root)
+        scc_stack.append(root)
+        on_stack[root] = 1
+        work_nodes.append(root)
+        work_edges.append(indptr[root])
         
-        return imports
+        while work_nodes:
+            node = work_nodes[-1]
+            edge = work_edges[-1]
+            end = indptr[node + 1]
+            while edge < end:
+                neighbor = indices[edge]
+                edge += 1
+                if index_of[neighbor] == -1:
+                    work_edges[-1] = edge
+                    index_of[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    discovered.append(neighbor)
+                    scc_stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work_nodes.append(neighbor)
+                    work_edges.append(indptr[neighbor])
+                    break
+                if on_stack[neighbor] and index_of[neighbor] < lowlink[node]:
+                    lowlink[node] = index_of[neighbor]
+            else:
+                # All neighbors explored: propagate lowlink and pop any SCC
+                work_nodes.pop()
+                work_edges.pop()
+                if work_nodes:
+                    parent = work_nodes[-1]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                
+                if lowlink[node] == index_of[node]:
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack[member] = 0
+                        component[member] = component_count
+                        if member == node:
+                            break
+                    component_count += 1
     
-    def _extract_structs(self, content: str) -> List[str]:
-        """Extract struct names"""
-        structs = []
-        pattern = r'type\s+(\w+)\s+struct'
-        matches = re.finditer(pattern, content)
-        for match in matches:
-            structs.append(match.group(1))
-        return structs
+    return component, discovered, component_count
 
 
 class DependencyGraphAnalyzer:
@@ -633,56 +959,117 @@ class DependencyGraphAnalyzer:
     
     def __init__(self):
         self.graph = defaultdict(set)
-        self.reverse_graph = defaultdict(set)
+        # Built on demand by _ensure_reverse; only get_dependents needs it
+        self._reverse = None
+        # CSR snapshot built by freeze(); None while edges are being added
+        self._indptr = None
+        self._indices = None
+        self._id_of = None
+        self._name_of = None
+    
+    def add_dependencies(self, table: DependencyTable):
+        """Add every distinct edge of a DependencyTable
+        
+        Edges are inserted straight into the adjacency sets from the table's
+        id columns, and the derived indexes are invalidated once per batch
+        rather than once per edge.
+        """
+        names = table.names
+        graph = self.graph
+        for source_id, target_id in table.edges():
+            graph[names[source_id]].add(names[target_id])
+        self._reverse = None
+        self._indptr = None
     
     def add_dependency(self, source: str, target: str):
         """Add a dependency relationship"""
         self.graph[source].add(target)
-        self.reverse_graph[target].add(source)
+        # A reverse index that was already built is kept current in place
+        # instead of being discarded and rebuilt on the next query
+        if self._reverse is not None:
+            self._reverse[target].add(source)
+        self._indptr = None
+    
+    def freeze(self):
+        """Snapshot the graph as CSR arrays over integer node ids
+        
+        Node i's dependencies are _indices[_indptr[i]:_indptr[i + 1]].
+        Nodes with outgoing edges get the lowest ids. The snapshot is
+        rebuilt after any later add_dependency.
+        """
+        if self._indptr is not None:
+            return
+        
+        name_of = list(self.graph)
+        id_of = {name: node_id for node_id, name in enumerate(name_of)}
+        indptr = array.array('i', [0])
+        indices = array.array('i')
+        
+        for name in list(name_of):
+            for target in self.graph[name]:
+                target_id = id_of.get(target)
+                if target_id is None:
+                    target_id = id_of[target] = len(name_of)
+                    name_of.append(target)
+                indices.append(target_id)
+            indptr.append(len(indices))
+        # Pure targets have no outgoing edges
+        indptr.extend([len(indices)] * (len(name_of) + 1 - len(indptr)))
+        
+        self._indptr = indptr
+        self._indices = indices
+        self._id_of = id_of
+        self._name_of = name_of
     
     def detect_cycles(self) -> List[List[str]]:
-        """Detect circular dependencies using DFS"""
-        visited = set()
-        rec_stack = set()
-        cycles = []
+        """Detect circular dependencies using an iterative Tarjan SCC search
         
-        def dfs(node: str, path: List[str]) -> bool:
-            if node in rec_stack:
-                # Find the cycle in the path
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                cycles.append(cycle)
-                return True
-            
-            if node in visited:
-                return False
-            
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-            
-            for neighbor in self.graph[node]:
-                if dfs(neighbor, path):
-                    # Don't return immediately to find all cycles
-                    pass
-            
-            rec_stack.remove(node)
-            path.pop()
-            return False
+        Every strongly connected component with more than one node, or a
+        node that depends on itself, is reported as a cycle. The cycle is
+        listed in discovery order and closed by repeating its first node.
+        """
+        self.freeze()
+        indptr = self._indptr
+        indices = self._indices
+        name_of = self._name_of
         
-        for node in list(self.graph.keys()):
-            if node not in visited:
-                dfs(node, [])
+        component, discovered, component_count = _tarjan_components(indptr, indices)
+        members = [[] for _ in range(component_count)]
+        for node in discovered:
+            members[component[node]].append(node)
         
+        cycles = []
+        for scc in members:
+            node = scc[0]
+            if len(scc) > 1 or node in indices[indptr[node]:indptr[node + 1]]:
+                cycle = [name_of[member] for member in scc]
+                cycle.append(cycle[0])
+                cycles.append(cycle)
         return cycles
     
     def get_dependencies(self, node: str) -> Set[str]:
         """Get all dependencies of a node"""
-        return self.graph[node].copy()
+        # get() rather than indexing, so unknown nodes aren't added to the graph
+        return set(self.graph.get(node, ()))
     
     def get_dependents(self, node: str) -> Set[str]:
         """Get all nodes that depend on this node"""
-        return self.reverse_graph[node].copy()
+        return set(self._ensure_reverse().get(node, ()))
+    
+    @property
+    def reverse_graph(self) -> Dict[str, Set[str]]:
+        """Map of each node to the nodes that depend on it"""
+        return self._ensure_reverse()
+    
+    def _ensure_reverse(self) -> Dict[str, Set[str]]:
+        """Build the reverse index from the forward graph if it is stale"""
+        if self._reverse is None:
+            reverse = defaultdict(set)
+            for source, targets in self.graph.items():
+                for target in targets:
+                    reverse[target].add(source)
+            self._reverse = reverse
+        return self._reverse
 
 
 class CodeGraphAnalyzer:
@@ -694,10 +1081,17 @@ class CodeGraphAnalyzer:
             JavaScriptParser(),
             GoParser()
         ]
+        self._by_ext = _parsers_by_extension(self.parsers)
         self.dependency_analyzer = DependencyGraphAnalyzer()
     
-    def analyze_project(self, project_path: str, exclude_patterns: List[str] = None) -> AnalysisResult:
-        """Analyze entire project"""
+    def analyze_project(self, project_path: str, exclude_patterns: List[str] = None,
+                        max_workers: Optional[int] = None, use_cache: bool = True,
+                        need: int = NEED_ALL) -> AnalysisResult:
+        """Analyze entire project, parsing files in parallel
+        
+        need selects which result sections the parsers compute; metrics
+        for sections left out are reported as zero.
+        """
         if exclude_patterns is None:
             exclude_patterns = [
                 '**/node_modules/**',
@@ -709,29 +1103,56 @@ class CodeGraphAnalyzer:
                 '**/build/**'
             ]
         
+        # Rebuilt here so that changes to self.parsers take effect
+        self._by_ext = _parsers_by_extension(self.parsers)
         all_files = self._find_source_files(project_path, exclude_patterns)
         
-        all_dependencies = []
+        dependency_table = DependencyTable()
         all_complexity = []
-        all_functions = []
+        function_count = 0
+        # Every function of a file repeats its path and one of a handful of
+        # labels, and records from worker processes arrive as fresh strings;
+        # interning shares one object per value across the whole result
+        intern = sys.intern
         
-        # Parse all files
-        for file_path in all_files:
-            parser = self._get_parser(file_path)
-            if parser:
-                result = parser.parse(file_path)
-                
-                all_dependencies.extend([
-                    DependencyInfo(**dep) for dep in result['dependencies']
-                ])
-                all_complexity.extend([
-                    ComplexityInfo(**comp) for comp in result['complexity']
-                ])
-                all_functions.extend(result['functions'])
-        
-        # Build dependency graph
-        for dep in all_dependencies:
-            self.dependency_analyzer.add_dependency(dep.source, dep.target)
+        # Parse all files; results are merged here in the main process.
+        # Configuring first means workers skip a cache that can't be opened
+        cache_root = parse_cache.configure(project_path if use_cache else None)
+        try:
+            if len(all_files) < _MIN_FILES_FOR_PROCESSES:
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+                parsers_by_ext = self._by_ext
+            else:
+                # Queue kernel read-ahead for the files the workers will read,
+                # skipping those the cache serves from their stat alone
+                io_backend.prefetch(parse_cache.stale_files(all_files))
+                # Workers receive the parser table once rather than per task
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(cache_root, self._by_ext)
+                )
+                parsers_by_ext = None
+            
+            with executor:
+                for records in executor.map(_parse_one, all_files, repeat(need), repeat(parsers_by_ext),
+                                            chunksize=16):
+                    for record in records:
+                        tag = record[0]
+                        if tag == 'dep':
+                            dependency_table.add(*record[1:])
+                        elif tag == 'cx':
+                            _, function, file, label, line, warning = record
+                            all_complexity.append(ComplexityInfo(
+                                function, intern(file), intern(label), line, warning
+                            ))
+                        else:
+                            function_count += 1
+        finally:
+            parse_cache.configure(None)
+        
+        # Build dependency graph from the interned edge ids
+        self.dependency_analyzer.add_dependencies(dependency_table)
         
         # Detect cycles
         cycles = self.dependency_analyzer.detect_cycles()
@@ -743,95 +1164,110 @@ class CodeGraphAnalyzer:
         # Calculate metrics
         metrics = ProjectMetrics(
             total_files=len(all_files),
-            total_functions=len(all_functions),
+            total_functions=function_count,
             average_complexity=self._calculate_average_complexity(all_complexity),
-            dependency_count=len(all_dependencies),
+            dependency_count=len(dependency_table),
             circular_dependencies=len(circular_deps)
         )
         
         return AnalysisResult(
-            dependencies=all_dependencies,
+            dependencies=list(dependency_table),
             complexity=all_complexity,
             cycles=circular_deps,
             metrics=metrics
         )
     
     def _find_source_files(self, project_path: str, exclude_patterns: List[str]) -> List[str]:
-        """Find all source files in project"""
-        source_files = []
-        project_path = Path(project_path)
+        """Find all source files in project, pruning excluded directories"""
+        # Bare names, '**/name' and '**/name/**' prune any file or directory
+        # with that name; the rest are globs matched against paths relative
+        # to the project root, compiled into one alternation so each path
+        # costs a single match call
+        pruned_names = set()
+        globs = []
+        for pattern in exclude_patterns:
+            name = pattern
+            if name.startswith('**/'):
+                name = name[3:]
+                if name.endswith('/**'):
+                    name = name[:-3]
+            if name and not any(ch in name for ch in '*?[/'):
+                pruned_names.add(name)
+            else:
+                globs.append(fnmatch.translate(pattern))
+                # A leading '**/' also matches zero directories, as in gitignore
+                if pattern.startswith('**/'):
+                    globs.append(fnmatch.translate(pattern[3:]))
+        excluded = re.compile('|'.join(globs)).match if globs else (lambda path: None)
         
-        for file_path in project_path.rglob('*'):
-            if file_path.is_file():
-                file_str = str(file_path)
-                
-                # Check if file should be excluded
-                should_exclude = False
-                for pattern in exclude_patterns:
-                    # Simple pattern matching (could be improved with fnmatch)
-                    if pattern.replace('**/', '').replace('/**', '') in file_str:
-                        should_exclude = True
-                        break
-                
-                if not should_exclude and self._get_parser(file_str):
-                    source_files.append(file_str)
+        return list(self._iter_source_files(project_path, '', pruned_names, excluded))
+    
+    def _iter_source_files(self, directory: str, rel_prefix: str, pruned_names: Set[str],
+                           excluded: Callable[[str], Any]) -> Iterator[str]:
+        """Yield parseable files under directory: its own files first, then subdirectories
+        
+        Entries are visited in name order; DirEntry caches the file type, so
+        no extra stat calls are made. Symlinked directories are not followed.
+        Directory globs may be written with or without a trailing slash.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if name in pruned_names:
+                continue
+            rel_path = rel_prefix + name
+            if entry.is_dir(follow_symlinks=False):
+                if not excluded(rel_path) and not excluded(rel_path + '/'):
+                    subdirs.append(entry)
+            elif entry.is_file() and _extension(name) in self._by_ext and not excluded(rel_path):
+                yield entry.path
         
-        return source_files
+        for entry in subdirs:
+            yield from self._iter_source_files(entry.path, rel_prefix + entry.name + '/', pruned_names, excluded)
     
     def _get_parser(self, file_path: str) -> Optional[BaseParser]:
         """Get appropriate parser for file"""
-        for parser in self.parsers:
-            if parser.can_parse(file_path):
-                return parser
-        return None
+        return self._by_ext.get(_extension(file_path))
     
     def _calculate_average_complexity(self, complexity_info: List[ComplexityInfo]) -> str:
         """Calculate average complexity across all functions"""
         if not complexity_info:
             return "O(1)"
         
-        # Simple complexity scoring for averaging
-        complexity_scores = {
-            "O(1)": 1,
-            "O(log n)": 2,
-            "O(n)": 3,
-            "O(n log n)": 4,
-            "O(n²)": 5,
-            "O(2^n)": 6,
-            "O(n!)": 7
-        }
-        
-        total_score = sum(complexity_scores.get(comp.complexity, 3) for comp in complexity_info)
+        # Count labels in C, then score each distinct label once
+        label_counts = Counter(comp.complexity for comp in complexity_info)
+        total_score = sum(
+            COMPLEXITY_SCORES.get(label, 3) * count for label, count in label_counts.items()
+        )
         avg_score = total_score / len(complexity_info)
         
-        # Map back to complexity
-        score_to_complexity = {
-            1: "O(1)", 2: "O(log n)", 3: "O(n)", 4: "O(n log n)",
-            5: "O(n²)", 6: "O(2^n)", 7: "O(n!)"
-        }
-        
-        return score_to_complexity.get(round(avg_score), "O(n)")
+        return SCORE_TO_COMPLEXITY.get(round(avg_score), "O(n)")
 
 
-def generate_html_report(analysis: AnalysisResult, output_path: str):
-    """Generate HTML report from analysis results"""
-    html_template = """
+# Static report header; $-placeholders leave the CSS braces as written
+_HTML_HEAD = string.Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>CodeGraph Analysis Report</title>
         <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .metric {{ background: #f5f5f5; padding: 10px; margin: 10px 0; border-radius: 5px; }}
-            .warning {{ background: #fff3cd; border: 1px solid #ffeaa7; }}
-            .error {{ background: #f8d7da; border: 1px solid #f5c6cb; }}
-            .dependency {{ margin: 5px 0; padding: 5px; background: #e9ecef; }}
-            .complexity-high {{ color: #dc3545; font-weight: bold; }}
-            .complexity-medium {{ color: #ffc107; }}
-            .complexity-low {{ color: #28a745; }}
-            table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-            th {{ background-color: #f2f2f2; }}
+            body { font-family: Arial, sans-serif; margin: 20px; }
+            .metric { background: #f5f5f5; padding: 10px; margin: 10px 0; border-radius: 5px; }
+            .warning { background: #fff3cd; border: 1px solid #ffeaa7; }
+            .error { background: #f8d7da; border: 1px solid #f5c6cb; }
+            .dependency { margin: 5px 0; padding: 5px; background: #e9ecef; }
+            .complexity-high { color: #dc3545; font-weight: bold; }
+            .complexity-medium { color: #ffc107; }
+            .complexity-low { color: #28a745; }
+            table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+            th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+            th { background-color: #f2f2f2; }
         </style>
     </head>
     <body>
@@ -839,76 +1275,112 @@ def generate_html_report(analysis: AnalysisResult, output_path: str):
         
         <div class="metric">
             <h2>Project Metrics</h2>
-            <p><strong>Total Files:</strong> {total_files}</p>
-            <p><strong>Total Functions:</strong> {total_functions}</p>
-            <p><strong>Average Complexity:</strong> {avg_complexity}</p>
-            <p><strong>Dependencies:</strong> {dependency_count}</p>
-            <p><strong>Circular Dependencies:</strong> {circular_deps}</p>
+            <p><strong>Total Files:</strong> $total_files</p>
+            <p><strong>Total Functions:</strong> $total_functions</p>
+            <p><strong>Average Complexity:</strong> $avg_complexity</p>
+            <p><strong>Dependencies:</strong> $dependency_count</p>
+            <p><strong>Circular Dependencies:</strong> $circular_deps</p>
         </div>
         
         <h2>Complexity Analysis</h2>
         <table>
             <tr><th>Function</th><th>File</th><th>Complexity</th><th>Warning</th></tr>
-            {complexity_rows}
+            """)
+
+_HTML_CYCLES = """
         </table>
         
         <h2>Circular Dependencies</h2>
-        {cycles_html}
+        """
+
+_HTML_DEPENDENCIES = """
         
         <h2>Dependencies</h2>
         <div>
-            {dependencies_html}
+            """
+
+_HTML_TAIL = """
         </div>
     </body>
     </html>
     """
-    
-    # Generate complexity rows
-    complexity_rows = ""
-    for comp in analysis.complexity:
-        css_class = "complexity-low"
-        if comp.complexity in ["O(n²)", "O(2^n)", "O(n!)"]:
-            css_class = "complexity-high"
-        elif comp.complexity in ["O(n)", "O(n log n)"]:
-            css_class = "complexity-medium"
+
+
+# Row class per complexity label; anything not listed is low
+_COMPLEXITY_CSS = {
+    "O(n²)": "complexity-high",
+    "O(2^n)": "complexity-high",
+    "O(n!)": "complexity-high",
+    "O(n)": "complexity-medium",
+    "O(n log n)": "complexity-medium",
+}
+
+
+def generate_html_report(analysis: AnalysisResult, output_path: str):
+    """Generate HTML report from analysis results"""
+    # Sections are written straight to the file as they are produced; names,
+    # paths and warnings come from analysed source, so they are escaped
+    with open(output_path, 'w', encoding='utf-8') as f:
+        write = f.write
+        write(_HTML_HEAD.substitute(
+            total_files=analysis.metrics.total_files,
+            total_functions=analysis.metrics.total_functions,
+            avg_complexity=escape(analysis.metrics.average_complexity),
+            dependency_count=analysis.metrics.dependency_count,
+            circular_deps=analysis.metrics.circular_dependencies
+        ))
         
-        complexity_rows += f"""
+        # Generate complexity rows
+        for comp in analysis.complexity:
+            css_class = _COMPLEXITY_CSS.get(comp.complexity, "complexity-low")
+            write(f"""
         <tr class="{css_class}">
-            <td>{comp.function}</td>
-            <td>{comp.file}</td>
-            <td>{comp.complexity}</td>
-            <td>{comp.warning or ''}</td>
+            <td>{escape(comp.function)}</td>
+            <td>{escape(comp.file)}</td>
+            <td>{escape(comp.complexity)}</td>
+            <td>{escape(comp.warning or '')}</td>
         </tr>
-        """
-    
-    # Generate cycles HTML
-    cycles_html = ""
-    for cycle in analysis.cycles:
-        css_class = "error" if cycle.severity == "error" else "warning"
-        cycles_html += f'<div class="{css_class}">{"→".join(cycle.cycle)}</div>'
-    
-    if not cycles_html:
-        cycles_html = '<div class="metric">No circular dependencies found!</div>'
-    
-    # Generate dependencies HTML
-    dependencies_html = ""
-    for dep in analysis.dependencies[:50]:  # Limit to first 50
-        dependencies_html += f'<div class="dependency">{dep.source} → {dep.target} ({dep.type})</div>'
-    
-    # Fill template
-    html_content = html_template.format(
-        total_files=analysis.metrics.total_files,
-        total_functions=analysis.metrics.total_functions,
-        avg_complexity=analysis.metrics.average_complexity,
-        dependency_count=analysis.metrics.dependency_count,
-        circular_deps=analysis.metrics.circular_dependencies,
-        complexity_rows=complexity_rows,
-        cycles_html=cycles_html,
-        dependencies_html=dependencies_html
-    )
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        """)
+        
+        # Generate cycles HTML
+        write(_HTML_CYCLES)
+        for cycle in analysis.cycles:
+            css_class = "error" if cycle.severity == "error" else "warning"
+            write(f'<div class="{css_class}">{escape("→".join(cycle.cycle))}</div>')
+        
+        if not analysis.cycles:
+            write('<div class="metric">No circular dependencies found!</div>')
+        
+        # Generate dependencies HTML
+        write(_HTML_DEPENDENCIES)
+        for dep in analysis.dependencies[:50]:  # Limit to first 50
+            write(f'<div class="dependency">{escape(dep.source)} → {escape(dep.target)} ({escape(dep.type)})</div>')
+        write(_HTML_TAIL)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize obj as indented UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _write_json(obj: Any):
+    """Write obj as JSON to stdout without building an intermediate str"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_json_bytes(obj) + b'\n')
+    sys.stdout.buffer.flush()
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
 
 
 def main():
@@ -920,71 +1392,84 @@ def main():
     parser.add_argument('--output', metavar='FILE', help='Output file for reports')
     parser.add_argument('--format', choices=['json', 'text', 'html'], default='text', help='Output format')
     parser.add_argument('--exclude', nargs='*', help='Patterns to exclude from analysis')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the parse cache')
+    parser.add_argument('--jobs', type=_positive_int, metavar='N', help='Parser worker processes (default: CPU count)')
     
     args = parser.parse_args()
     
     analyzer = CodeGraphAnalyzer()
     
     if args.analyze:
-        result = analyzer.analyze_project(args.analyze, args.exclude)
+        result = analyzer.analyze_project(args.analyze, args.exclude, max_workers=args.jobs,
+                                          use_cache=not args.no_cache)
         
         if args.format == 'json':
             output = asdict(result)
             if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(output, f, indent=2)
+                with open(args.output, 'wb') as f:
+                    f.write(_json_bytes(output))
             else:
-                print(json.dumps(output, indent=2))
+                _write_json(output)
         elif args.format == 'html':
             output_file = args.output or 'codegraph-report.html'
             generate_html_report(result, output_file)
             print(f"HTML report generated: {output_file}")
         else:  # text format
-            print(f"📊 CodeGraph Analysis Results")
-            print(f"Files analyzed: {result.metrics.total_files}")
-            print(f"Functions found: {result.metrics.total_functions}")
-            print(f"Dependencies: {result.metrics.dependency_count}")
-            print(f"Circular dependencies: {result.metrics.circular_dependencies}")
+            # Lines are collected and written once rather than printed one by one
+            lines = [
+                f"📊 CodeGraph Analysis Results",
+                f"Files analyzed: {result.metrics.total_files}",
+                f"Functions found: {result.metrics.total_functions}",
+                f"Dependencies: {result.metrics.dependency_count}",
+                f"Circular dependencies: {result.metrics.circular_dependencies}"
+            ]
             
             if result.complexity:
-                print(f"\n🔍 Complexity Analysis:")
+                lines.append(f"\n🔍 Complexity Analysis:")
                 for comp in result.complexity:
                     status = "⚠️" if comp.warning else "✅"
-                    print(f"  {status} {comp.function} ({comp.complexity}) - {comp.file}:{comp.line}")
+                    lines.append(f"  {status} {comp.function} ({comp.complexity}) - {comp.file}:{comp.line}")
             
             if result.cycles:
-                print(f"\n🔄 Circular Dependencies:")
+                lines.append(f"\n🔄 Circular Dependencies:")
                 for cycle in result.cycles:
-                    print(f"  ⚠️ {' → '.join(cycle.cycle)}")
+                    lines.append(f"  ⚠️ {' → '.join(cycle.cycle)}")
+            
+            sys.stdout.write('\n'.join(lines) + '\n')
     
     elif args.complexity:
         # Single file complexity check
-        parser = analyzer._get_parser(args.complexity)
-        if parser:
-            result = parser.parse(args.complexity)
+        file_parser = analyzer._get_parser(args.complexity)
+        if file_parser:
+            result = file_parser.parse(args.complexity, NEED_COMPLEXITY)
             complexity = result['complexity']
             
             if args.format == 'json':
-                print(json.dumps({'complexity': complexity}, indent=2))
+                _write_json({'complexity': complexity})
             else:
+                lines = []
                 for comp in complexity:
-                    print(f"{comp['function']}: {comp['complexity']}")
+                    lines.append(f"{comp['function']}: {comp['complexity']}")
                     if comp.get('warning'):
-                        print(f"  Warning: {comp['warning']}")
+                        lines.append(f"  Warning: {comp['warning']}")
+                if lines:
+                    sys.stdout.write('\n'.join(lines) + '\n')
         else:
             print(f"No parser available for {args.complexity}")
     
     elif args.check_cycles:
-        result = analyzer.analyze_project(args.check_cycles, args.exclude)
+        result = analyzer.analyze_project(args.check_cycles, args.exclude, max_workers=args.jobs,
+                                          use_cache=not args.no_cache, need=NEED_DEPS)
         
         if args.format == 'json':
             output = {'cycles': [asdict(cycle) for cycle in result.cycles]}
-            print(json.dumps(output, indent=2))
+            _write_json(output)
         else:
             if result.cycles:
-                print("Circular dependencies found:")
+                lines = ["Circular dependencies found:"]
                 for cycle in result.cycles:
-                    print(f"  {' → '.join(cycle.cycle)} ({cycle.severity})")
+                    lines.append(f"  {' → '.join(cycle.cycle)} ({cycle.severity})")
+                sys.stdout.write('\n'.join(lines) + '\n')
             else:
                 print("No circular dependencies found!")
     
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+CodeGraph I/O Backend
+Batch read-ahead of source files ahead of parsing
+"""
+
+import os
+from typing import Iterable
+
+
+# posix_fadvise is only available on Linux and some other POSIX systems
+HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+
+def prefetch(paths: Iterable[str]) -> int:
+    """Ask the kernel to start reading every file in paths into page cache
+
+    POSIX_FADV_WILLNEED queues asynchronous read-ahead and returns at
+    once, so the whole batch is in flight before the parsers issue
+    their blocking reads. Returns the number of files advised; on
+    platforms without posix_fadvise this is a no-op returning 0.
+    """
+    if not HAS_FADVISE:
+        return 0
+
+    advised = 0
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            advised += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return advised
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+CodeGraph Parse Cache
+Persistent SQLite store of parser results keyed by file path and content hash,
+with an (mtime, size) index so unchanged files are not even read
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+
+CACHE_FILENAME = '.codegraph_cache.sqlite'
+
+# Bump whenever any parser's output changes, so stored results are dropped
+CACHE_VERSION = 2
+
+# Files modified this recently may change again within the same mtime tick,
+# so their stat is not trusted as a cache key (git's "racy" entries)
+_RACY_WINDOW_NS = 2 * 10**9
+
+# Project root of the active cache, or None when caching is disabled
+_cache_root: Optional[str] = None
+# Connections are opened lazily per thread and never shared across processes
+_local = threading.local()
+# Set once this process has reported that the cache is unusable
+_warned = False
+
+
+class ParseCache:
+    """SQLite-backed mapping of (path, sha256) to a pickled parse result"""
+
+    def __init__(self, project_root: str):
+        self.path = Path(project_root) / CACHE_FILENAME
+        self.pid = os.getpid()
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        # WAL stays consistent without an fsync per commit; a crash can at
+        # worst lose recent entries, which are simply parsed again
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        if self._conn.execute('PRAGMA user_version').fetchone()[0] != CACHE_VERSION:
+            self._conn.execute('DROP TABLE IF EXISTS parses')
+            self._conn.execute('DROP TABLE IF EXISTS stats')
+            self._conn.execute(f'PRAGMA user_version = {CACHE_VERSION:d}')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS parses ('
+            'path TEXT, sha BLOB, payload BLOB, PRIMARY KEY(path, sha))'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS stats ('
+            'path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha BLOB)'
+        )
+        self._conn.commit()
+
+    def get(self, file_path: str, sha: bytes) -> Optional[Dict[str, Any]]:
+        """Return the cached result for this file content, if any"""
+        row = self._conn.execute(
+            'SELECT payload FROM parses WHERE path=? AND sha=?', (file_path, sha)
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def get_by_stat(self, file_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+        """Return the cached result if the file's mtime and size are unchanged"""
+        row = self._conn.execute(
+            'SELECT parses.payload FROM stats JOIN parses USING (path, sha) '
+            'WHERE stats.path=? AND stats.mtime_ns=? AND stats.size=?',
+            (file_path, mtime_ns, size)
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def stat_index(self) -> Dict[str, Tuple[int, int]]:
+        """Map each path with a servable stat entry to its (mtime_ns, size)"""
+        rows = self._conn.execute(
+            'SELECT stats.path, stats.mtime_ns, stats.size FROM stats JOIN parses USING (path, sha)'
+        )
+        return {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+
+    def put_stat(self, file_path: str, sha: bytes, mtime_ns: int, size: int):
+        """Record that the file with this mtime and size hashes to sha"""
+        self._conn.execute(
+            'INSERT OR REPLACE INTO stats (path, mtime_ns, size, sha) VALUES (?, ?, ?, ?)',
+            (file_path, mtime_ns, size, sha)
+        )
+
+    def put(self, file_path: str, sha: bytes, result: Dict[str, Any]):
+        """Store a parse result for this file content, replacing older ones"""
+        self._conn.execute('DELETE FROM parses WHERE path=? AND sha<>?', (file_path, sha))
+        self._conn.execute(
+            'INSERT OR REPLACE INTO parses (path, sha, payload) VALUES (?, ?, ?)',
+            (file_path, sha, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+
+    def commit(self):
+        """Commit the writes made since the last commit"""
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        self._conn.close()
+
+
+def configure(project_root: Optional[str]) -> Optional[str]:
+    """Enable caching under project_root, or disable it when None
+
+    The cache is opened straight away, so an unwritable project disables
+    it here. Returns the root actually in use, or None.
+    """
+    global _cache_root
+    _cache_root = project_root
+    cache = getattr(_local, 'cache', None)
+    if cache is not None:
+        # A connection inherited through fork must not be used or closed
+        # here; dropping the reference leaves it to the parent
+        if cache.pid == os.getpid():
+            cache.close()
+        _local.cache = None
+    _active_cache()
+    return _cache_root
+
+
+def _disable(error: Exception):
+    """Turn caching off for this process after a database error
+
+    A broken cache must never cost analysis results, so parsing simply
+    continues uncached. The warning is printed once per process.
+    """
+    global _cache_root, _warned
+    _cache_root = None
+    if not _warned:
+        _warned = True
+        print(f"Warning: parse cache disabled: {error}", file=sys.stderr)
+
+
+def _active_cache() -> Optional[ParseCache]:
+    """Return this thread's cache connection, opening it on first use"""
+    if _cache_root is None:
+        return None
+    cache = getattr(_local, 'cache', None)
+    # A connection inherited through fork belongs to the parent process
+    if cache is None or cache.pid != os.getpid() or cache.path.parent != Path(_cache_root):
+        try:
+            cache = ParseCache(_cache_root)
+        except sqlite3.Error as e:
+            _disable(e)
+            return None
+        _local.cache = cache
+    return cache
+
+
+def lookup(file_path: str) -> Optional[Dict[str, Any]]:
+    """Return the stored result for file_path without reading it, if unchanged
+
+    The stat taken here is remembered so that a following cached_parse
+    call records the metadata observed before the file was read.
+    """
+    cache = _active_cache()
+    if cache is None:
+        return None
+    st = os.stat(file_path)
+    _local.stat = (file_path, st.st_mtime_ns, st.st_size)
+    try:
+        return cache.get_by_stat(file_path, st.st_mtime_ns, st.st_size)
+    except sqlite3.Error as e:
+        _disable(e)
+        return None
+
+
+def stale_files(file_paths: Iterable[str]) -> List[str]:
+    """Return the paths that lookup can't serve without reading the file
+
+    Every path is stale while caching is disabled. Used to limit
+    read-ahead to the files that will actually be read.
+    """
+    cache = _active_cache()
+    if cache is None:
+        return list(file_paths)
+    try:
+        known = cache.stat_index()
+    except sqlite3.Error as e:
+        _disable(e)
+        return list(file_paths)
+
+    stale = []
+    for file_path in file_paths:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            stale.append(file_path)
+            continue
+        if known.get(file_path) != (st.st_mtime_ns, st.st_size):
+            stale.append(file_path)
+    return stale
+
+
+def cached_parse(parse):
+    """Decorator for a parser's (self, source_bytes, file_path, *narrowing) method
+
+    The bytes already read for parsing are the ones hashed, so each file
+    is read once whether or not the cache hits. Extra arguments narrow
+    what the parser computes: a stored full result still satisfies such
+    a call, but its partial result is never stored.
+    """
+    @functools.wraps(parse)
+    def wrapper(self, source: bytes, file_path: str, *narrowing) -> Dict[str, Any]:
+        cache = _active_cache()
+        if cache is None:
+            return parse(self, source, file_path, *narrowing)
+
+        stat = getattr(_local, 'stat', None)
+        _local.stat = None
+        sha = hashlib.sha256(source).digest()
+        try:
+            cached = cache.get(file_path, sha)
+        except sqlite3.Error as e:
+            _disable(e)
+            return parse(self, source, file_path, *narrowing)
+        result = cached
+        if cached is None:
+            result = parse(self, source, file_path, *narrowing)
+            if narrowing:
+                return result
+
+        try:
+            if cached is None:
+                cache.put(file_path, sha, result)
+            if stat is not None and stat[0] == file_path and time.time_ns() - stat[1] > _RACY_WINDOW_NS:
+                cache.put_stat(file_path, sha, stat[1], stat[2])
+            cache.commit()
+        except sqlite3.Error as e:
+            _disable(e)
+        return result
+
+    return wrapper
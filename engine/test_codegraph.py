@@ -3,12 +3,16 @@
 Test suite for CodeGraph analysis engine
 """
 
+import ast
 import unittest
 import os
+import sqlite3
 import tempfile
 import json
+import mmap
 from pathlib import Path
 import sys
+from unittest import mock
 
 # Add the engine directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -18,8 +22,18 @@ from codegraph import (
     PythonParser, 
     JavaScriptParser, 
     GoParser,
-    DependencyGraphAnalyzer
+    DependencyGraphAnalyzer,
+    DependencyTable,
+    DependencyInfo,
+    ComplexityInfo,
+    AnalysisResult,
+    ProjectMetrics,
+    generate_html_report,
+    NEED_DEPS
 )
+import codegraph
+import io_backend
+import parse_cache
 
 
 class TestPythonParser(unittest.TestCase):
@@ -85,6 +99,59 @@ class TestClass:
             # Clean up
             os.unlink(f.name)
 
+    
+    def test_parse_honours_coding_declaration(self):
+        """Test that non-UTF-8 sources with a PEP 263 declaration parse"""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.py', delete=False) as f:
+            f.write("# -*- coding: latin-1 -*-\ndef caf\u00e9():\n    return '\u00e9'\n".encode('latin-1'))
+            f.flush()
+            
+            result = self.parser.parse(f.name)
+            self.assertEqual(result['functions'], ['caf\u00e9'])
+
+            os.unlink(f.name)
+
+    def test_parse_iter_yields_tagged_records(self):
+        """Test that parse_iter streams the same data as parse"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write("import os\n\ndef walk(items):\n    for item in items:\n        pass\n")
+            f.flush()
+
+            records = list(self.parser.parse_iter(f.name))
+            self.assertIn(('dep', f.name, 'os', 'import', 1, 0), records)
+            self.assertIn(('cx', 'walk', f.name, 'O(n)', 3, None), records)
+            self.assertIn(('fn', 'walk'), records)
+
+            os.unlink(f.name)
+
+    def test_identical_sources_are_parsed_once(self):
+        """Test that a repeated source reuses the cached summary"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, name) for name in ("a.py", "b.py")]
+            for path in paths:
+                with open(path, 'w') as f:
+                    f.write("import os\n\ndef same():\n    return 1\n")
+
+            with mock.patch('codegraph.ast.parse', wraps=ast.parse) as parse:
+                results = [self.parser.parse(path) for path in paths]
+            self.assertEqual(parse.call_count, 1)
+            self.assertEqual([r['dependencies'][0]['source'] for r in results], paths)
+            self.assertEqual(results[0]['functions'], results[1]['functions'])
+
+    def test_mutating_a_result_leaves_the_summary_intact(self):
+        """Test that results handed out don't share lists with the cache"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "shared.py")
+            with open(path, 'w') as f:
+                f.write("import os\n\nclass Kept:\n    pass\n\ndef kept():\n    return 1\n")
+
+            first = self.parser.parse(path)
+            for section in ('functions', 'imports', 'classes'):
+                first[section].append('injected')
+            second = self.parser.parse(path)
+            self.assertEqual(second['functions'], ['kept'])
+            self.assertEqual(second['imports'], ['os'])
+            self.assertEqual(second['classes'], ['Kept'])
 
 class TestJavaScriptParser(unittest.TestCase):
     """Test JavaScript parser"""
@@ -148,6 +215,57 @@ class TestClass {
             
             os.unlink(f.name)
 
+    
+    def test_function_body_ignores_braces_in_strings(self):
+        """Test that braces in strings and comments don't end a function early"""
+        content = b"""function pairs(items) {
+    const close = "}";  // another } here
+    for (const a of items) {
+        for (const b of items) {
+            console.log(a, b);
+        }
+    }
+}
+"""
+        newlines = self.parser._newline_offsets(content)
+        functions = self.parser._extract_functions_with_lines(content, newlines)
+        
+        self.assertEqual(len(functions), 1)
+        func_name, line_num, body = functions[0]
+        self.assertEqual((func_name, line_num), ('pairs', 1))
+        self.assertEqual(body, content.rstrip(b'\n'))
+        self.assertEqual(self.parser._estimate_js_complexity(body), 'O(n²)')
+
+    def test_large_files_are_memory_mapped(self):
+        """Test that files above the mmap threshold parse like small ones"""
+        source = "import x from 'lib';\nfunction loop(a) {\n    for (const i of a) {}\n}\n"
+        padding = "// " + "x" * 100 + "\n"
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
+            f.write(source + padding * 1000)
+            f.flush()
+
+            with mock.patch('codegraph.mmap.mmap', wraps=mmap.mmap) as mapped:
+                result = self.parser.parse(f.name)
+            self.assertTrue(mapped.called)
+            self.assertEqual(result['imports'], ['lib'])
+            self.assertEqual(result['functions'], ['loop'])
+            self.assertEqual(result['complexity'][0]['complexity'], 'O(n)')
+
+            os.unlink(f.name)
+
+    def test_non_ascii_identifiers(self):
+        """Test that names outside ASCII are captured whole"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.js', encoding='utf-8', delete=False) as f:
+            f.write("function caf\u00e9(a) {\n    return a;\n}\n"
+                    "const r\u00e9sum\u00e9 = (x) => x;\nclass \u00c9t\u00e9 extends B\u00e4se {}\n")
+            f.flush()
+
+            result = self.parser.parse(f.name)
+            self.assertEqual(result['functions'], ['caf\u00e9', 'r\u00e9sum\u00e9'])
+            self.assertEqual(result['classes'], ['\u00c9t\u00e9'])
+            self.assertEqual(result['complexity'][0]['function'], 'caf\u00e9')
+
+            os.unlink(f.name)
 
 class TestGoParser(unittest.TestCase):
     """Test Go parser"""
@@ -217,6 +335,20 @@ func (t *TestStruct) Method() string {
             
             os.unlink(f.name)
 
+    def test_non_ascii_identifiers(self):
+        """Test that names outside ASCII are captured whole"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.go', encoding='utf-8', delete=False) as f:
+            f.write("package main\n\ntype \u00c9tat struct {\n    N int\n}\n\n"
+                    "func D\u00e9j\u00e0(items []int) {\n    for range items {\n    }\n}\n")
+            f.flush()
+
+            result = self.parser.parse(f.name)
+            self.assertEqual(result['functions'], ['D\u00e9j\u00e0'])
+            self.assertEqual(result['structs'], ['\u00c9tat'])
+            self.assertEqual(result['complexity'][0]['complexity'], 'O(n)')
+
+            os.unlink(f.name)
+
 
 class TestDependencyGraphAnalyzer(unittest.TestCase):
     """Test dependency graph analysis"""
@@ -234,7 +366,17 @@ class TestDependencyGraphAnalyzer(unittest.TestCase):
         
         dependents_b = self.analyzer.get_dependents("B")
         self.assertIn("A", dependents_b)
-    
+
+    def test_lookups_track_later_edges(self):
+        """Test that queries stay correct as edges keep arriving"""
+        self.assertEqual(self.analyzer.get_dependencies("X"), set())
+        self.assertNotIn("X", self.analyzer.graph)
+
+        self.analyzer.add_dependency("A", "B")
+        self.assertEqual(self.analyzer.get_dependents("B"), {"A"})
+        self.analyzer.add_dependency("C", "B")
+        self.assertEqual(self.analyzer.get_dependents("B"), {"A", "C"})
+
     def test_cycle_detection(self):
         """Test circular dependency detection"""
         # Create a cycle: A -> B -> C -> A
@@ -253,6 +395,32 @@ class TestDependencyGraphAnalyzer(unittest.TestCase):
                 break
         self.assertTrue(found_cycle)
     
+    def test_cycles_across_branches(self):
+        """Test that every cycle is found, including self-loops"""
+        # A -> B -> C -> B reached after visiting A -> D first
+        self.analyzer.add_dependency("A", "D")
+        self.analyzer.add_dependency("A", "B")
+        self.analyzer.add_dependency("B", "C")
+        self.analyzer.add_dependency("C", "B")
+        self.analyzer.add_dependency("D", "D")
+        
+        cycles = self.analyzer.detect_cycles()
+        members = sorted(sorted(set(cycle)) for cycle in cycles)
+        self.assertEqual(members, [["B", "C"], ["D"]])
+        for cycle in cycles:
+            self.assertEqual(cycle[0], cycle[-1])
+    
+    def test_deep_chain_does_not_recurse(self):
+        """Test cycle detection on chains deeper than the recursion limit"""
+        depth = sys.getrecursionlimit() + 100
+        for i in range(depth):
+            self.analyzer.add_dependency(f"n{i}", f"n{i + 1}")
+        self.analyzer.add_dependency(f"n{depth}", "n0")
+        
+        cycles = self.analyzer.detect_cycles()
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(len(cycles[0]), depth + 2)
+    
     def test_no_cycles(self):
         """Test detection when no cycles exist"""
         # Create a DAG: A -> B -> C
@@ -263,6 +431,35 @@ class TestDependencyGraphAnalyzer(unittest.TestCase):
         self.assertEqual(len(cycles), 0)
 
 
+class TestDependencyTable(unittest.TestCase):
+    """Test the column-oriented dependency store"""
+    
+    def test_round_trip_and_interning(self):
+        """Test that edges come back intact and names are stored once"""
+        table = DependencyTable()
+        table.add("a.py", "os", "import", 1, 0)
+        table.add("b.py", "os", "import", 3, 4)
+        table.add("b.py", "os", "import", 5, 0)
+        
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.names, ["a.py", "os", "b.py"])
+        self.assertEqual(list(table)[1], DependencyInfo("b.py", "os", "import", 3, 4))
+        self.assertEqual(len(table.edges()), 2)
+        
+        graph = DependencyGraphAnalyzer()
+        graph.add_dependencies(table)
+        self.assertEqual(graph.get_dependencies("b.py"), {"os"})
+
+
+class RenamingPythonParser(PythonParser):
+    """Python parser that prefixes analysed function names, to spot which parser ran"""
+    
+    def _parse_rows(self, file_path, need=codegraph.NEED_ALL):
+        result = super()._parse_rows(file_path, need)
+        result['complexity'] = [row[:1] + ('custom_' + row[1],) + row[2:] for row in result['complexity']]
+        return result
+
+
 class TestCodeGraphAnalyzer(unittest.TestCase):
     """Test main analyzer"""
     
@@ -316,6 +513,310 @@ def complex_function(items):
             import_targets = [d.target for d in result.dependencies]
             self.assertIn('os', import_targets)
             self.assertIn('json', import_targets)
+    
+    def test_find_source_files_honours_excludes(self):
+        """Test that excluded directories and globs are skipped"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for rel_path in ["app.py", "lib/util.js", "lib/util.min.js",
+                             "node_modules/pkg/index.js", "src/.git/hook.py",
+                             "legit.github/main.go", "notes.txt",
+                             "tests/test_app.py", "lib/tests/test_util.js", "build/gen/out.js"]:
+                full_path = os.path.join(tmpdir, *rel_path.split('/'))
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                with open(full_path, 'w') as f:
+                    f.write("")
+            
+            def find(patterns):
+                files = self.analyzer._find_source_files(tmpdir, patterns)
+                return sorted(os.path.relpath(f, tmpdir).replace(os.sep, '/') for f in files)
+            
+            self.assertEqual(
+                find(['**/node_modules/**', '**/.git/**', '*.min.js', '**/tests/**', 'build/**']),
+                ["app.py", "legit.github/main.go", "lib/util.js"]
+            )
+            # Bare names and '**/name' prune at any depth, like --exclude node_modules
+            self.assertEqual(
+                find(['node_modules', '**/.git', 'tests', '**/build', 'util.min.js']),
+                ["app.py", "legit.github/main.go", "lib/util.js"]
+            )
+            # A leading '**/' also matches at the project root
+            self.assertEqual(find(['**/app.p?', '**/lib/*.js', '**/node_modules', '**/.git', '**/tests']),
+                             ["build/gen/out.js", "legit.github/main.go"])
+            # Directory globs match with or without a trailing slash
+            self.assertEqual(find(['*/gen', 'lib/tests/']), [
+                "app.py", "legit.github/main.go", "lib/util.js", "lib/util.min.js",
+                "node_modules/pkg/index.js", "src/.git/hook.py", "tests/test_app.py",
+            ])
+
+    def test_parser_lookup_ignores_extension_case(self):
+        """Test that upper-case extensions resolve to the same parser"""
+        self.assertIsInstance(self.analyzer._get_parser("Main.PY"), PythonParser)
+        self.assertIsInstance(self.analyzer._get_parser("App.TSX"), JavaScriptParser)
+        self.assertIsNone(self.analyzer._get_parser("README.md"))
+
+    def test_analyze_project_uses_the_analyzers_parsers(self):
+        """Test that threads and pool workers both parse with self.parsers"""
+        for file_count in (2, codegraph._MIN_FILES_FOR_PROCESSES):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                for i in range(file_count):
+                    with open(os.path.join(tmpdir, f"mod{i}.py"), 'w') as f:
+                        f.write(f"def func{i}():\n    return {i}\n")
+                
+                analyzer = CodeGraphAnalyzer()
+                analyzer.parsers = [RenamingPythonParser()]
+                result = analyzer.analyze_project(tmpdir, use_cache=False)
+                self.assertEqual(
+                    sorted(c.function for c in result.complexity),
+                    [f"custom_func{i}" for i in range(file_count)]
+                )
+
+    def test_cli_rejects_non_positive_jobs(self):
+        """Test that --jobs below 1 is a usage error, not a pool crash"""
+        for jobs in ('0', '-1'):
+            argv = ['codegraph.py', '--analyze', '.', '--jobs', jobs]
+            with mock.patch.object(sys, 'argv', argv), mock.patch('sys.stderr'), \
+                 mock.patch.object(CodeGraphAnalyzer, 'analyze_project') as analyze:
+                with self.assertRaises(SystemExit) as raised:
+                    codegraph.main()
+            self.assertEqual(raised.exception.code, 2)
+            self.assertFalse(analyze.called)
+
+    def test_analyze_project_in_parallel(self):
+        """Test that projects large enough for the process pool are fully parsed"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(10):
+                with open(os.path.join(tmpdir, f"module_{i}.py"), 'w') as f:
+                    f.write(f"import os\n\ndef function_{i}():\n    return {i}\n")
+            
+            result = self.analyzer.analyze_project(tmpdir, max_workers=2)
+            
+            self.assertEqual(result.metrics.total_files, 10)
+            self.assertEqual(result.metrics.total_functions, 10)
+            self.assertEqual(len(result.dependencies), 10)
+            complexity_funcs = sorted(c.function for c in result.complexity)
+            self.assertEqual(complexity_funcs, sorted(f"function_{i}" for i in range(10)))
+
+
+class TestAverageComplexity(unittest.TestCase):
+    """Test project-wide complexity averaging"""
+    
+    def test_average_complexity(self):
+        """Test that labels are averaged by their ordinal score"""
+        analyzer = CodeGraphAnalyzer()
+        labels = ["O(1)", "O(n)", "O(n)", "O(n²)"]
+        complexity = [ComplexityInfo(f"f{i}", "f.py", label, i) for i, label in enumerate(labels)]
+        
+        self.assertEqual(analyzer._calculate_average_complexity(complexity), "O(n)")
+        self.assertEqual(analyzer._calculate_average_complexity([]), "O(1)")
+
+
+class TestParseCache(unittest.TestCase):
+    """Test the persistent parse cache"""
+    
+    def test_unchanged_files_are_served_from_cache(self):
+        """Test that a second run reuses results until the file changes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            py_file = os.path.join(tmpdir, "cached.py")
+            with open(py_file, 'w') as f:
+                f.write("import os\n\ndef first():\n    return 1\n")
+            
+            CodeGraphAnalyzer().analyze_project(tmpdir)
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, parse_cache.CACHE_FILENAME)))
+            
+            with mock.patch.object(PythonParser, '_walk_once', side_effect=AssertionError):
+                result = CodeGraphAnalyzer().analyze_project(tmpdir)
+            self.assertEqual([c.function for c in result.complexity], ['first'])
+            
+            with open(py_file, 'w') as f:
+                f.write("import os\n\ndef second():\n    return 2\n")
+            result = CodeGraphAnalyzer().analyze_project(tmpdir)
+            self.assertEqual([c.function for c in result.complexity], ['second'])
+
+            cache = parse_cache.ParseCache(tmpdir)
+            rows = cache._conn.execute('SELECT COUNT(*) FROM parses').fetchone()[0]
+            cache.close()
+            self.assertEqual(rows, 1)
+
+    def test_unchanged_stat_skips_reading(self):
+        """Test that files with a known mtime and size are not read again"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            py_file = os.path.join(tmpdir, "settled.py")
+            with open(py_file, 'w') as f:
+                f.write("def settled():\n    return 1\n")
+            # Backdate the file so its stat is outside the racy window
+            os.utime(py_file, ns=(10**18, 10**18))
+
+            CodeGraphAnalyzer().analyze_project(tmpdir)
+            with mock.patch('builtins.open', side_effect=AssertionError):
+                result = CodeGraphAnalyzer().analyze_project(tmpdir)
+            self.assertEqual([c.function for c in result.complexity], ['settled'])
+
+    def test_stale_files_lists_files_that_will_be_read(self):
+        """Test that only files the stat index can't serve are prefetched"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, name) for name in ("settled.py", "edited.py")]
+            for path in paths:
+                with open(path, 'w') as f:
+                    f.write("def settled():\n    return 1\n")
+                os.utime(path, ns=(10**18, 10**18))
+
+            CodeGraphAnalyzer().analyze_project(tmpdir)
+            with open(paths[1], 'a') as f:
+                f.write("\ndef edited():\n    return 2\n")
+
+            try:
+                parse_cache.configure(tmpdir)
+                self.assertEqual(parse_cache.stale_files(paths), paths[1:])
+            finally:
+                parse_cache.configure(None)
+            self.assertEqual(parse_cache.stale_files(paths), paths)
+
+    def test_cache_version_change_discards_results(self):
+        """Test that results stored by another parser version are not served"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "versioned.py"), 'w') as f:
+                f.write("def versioned():\n    return 1\n")
+
+            CodeGraphAnalyzer().analyze_project(tmpdir)
+            summarize = mock.patch.object(PythonParser, '_summarize', autospec=True,
+                                          side_effect=PythonParser._summarize)
+            with mock.patch.object(parse_cache, 'CACHE_VERSION', parse_cache.CACHE_VERSION + 1), \
+                 summarize as summarize_source:
+                result = CodeGraphAnalyzer().analyze_project(tmpdir)
+            self.assertTrue(summarize_source.called)
+            self.assertEqual([c.function for c in result.complexity], ['versioned'])
+
+    def test_configure_leaves_inherited_connection_open(self):
+        """Test that a connection from before a fork is dropped, not closed"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            try:
+                parse_cache.configure(tmpdir)
+                inherited = parse_cache._local.cache
+                inherited.pid = -1
+                with mock.patch.object(parse_cache.ParseCache, 'close') as close:
+                    parse_cache.configure(tmpdir)
+                self.assertFalse(close.called)
+                self.assertIsNot(parse_cache._local.cache, inherited)
+            finally:
+                parse_cache.configure(None)
+                inherited._conn.close()
+
+    def test_cache_can_be_disabled(self):
+        """Test that use_cache=False leaves no cache file behind"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "plain.py"), 'w') as f:
+                f.write("def plain():\n    return 1\n")
+            
+            CodeGraphAnalyzer().analyze_project(tmpdir, use_cache=False)
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, parse_cache.CACHE_FILENAME)))
+
+    def test_unusable_cache_falls_back_to_parsing(self):
+        """Test that a cache that can't be opened or used costs no results"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "plain.py"), 'w') as f:
+                f.write("import os\n\ndef plain():\n    return 1\n")
+
+            failure = sqlite3.OperationalError("unable to open database file")
+            for target in ('parse_cache.sqlite3.connect', 'parse_cache.ParseCache.get_by_stat'):
+                with mock.patch(target, side_effect=failure), mock.patch('sys.stderr'):
+                    result = CodeGraphAnalyzer().analyze_project(tmpdir)
+                self.assertEqual(result.metrics.total_functions, 1)
+                self.assertEqual([d.target for d in result.dependencies], ['os'])
+
+    def test_narrowed_results_are_not_cached(self):
+        """Test that a dependencies-only run doesn't poison later full runs"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "deps.py"), 'w') as f:
+                f.write("import os\n\ndef loop(items):\n    for item in items:\n        pass\n")
+
+            result = CodeGraphAnalyzer().analyze_project(tmpdir, need=NEED_DEPS)
+            self.assertEqual([d.target for d in result.dependencies], ['os'])
+            self.assertEqual(result.complexity, [])
+
+            result = CodeGraphAnalyzer().analyze_project(tmpdir)
+            self.assertEqual([c.complexity for c in result.complexity], ['O(n)'])
+            self.assertEqual(result.metrics.total_functions, 1)
+
+    def test_narrowed_run_on_warm_cache_matches_cold(self):
+        """Test that a stored full result is narrowed like a fresh parse"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            py_file = os.path.join(tmpdir, "deps.py")
+            with open(py_file, 'w') as f:
+                f.write("import os\n\ndef loop(items):\n    for item in items:\n        pass\n")
+
+            cold = CodeGraphAnalyzer().analyze_project(tmpdir, need=NEED_DEPS, use_cache=False)
+            CodeGraphAnalyzer().analyze_project(tmpdir)
+            # Once served by content hash, once by the backdated stat
+            for _ in range(2):
+                warm = CodeGraphAnalyzer().analyze_project(tmpdir, need=NEED_DEPS)
+                self.assertEqual(warm.complexity, cold.complexity)
+                self.assertEqual(warm.metrics.total_functions, 0)
+                self.assertEqual([d.target for d in warm.dependencies], ['os'])
+                os.utime(py_file, ns=(10**18, 10**18))
+                CodeGraphAnalyzer().analyze_project(tmpdir)
+
+
+class TestIoBackend(unittest.TestCase):
+    """Test batch read-ahead"""
+    
+    def test_prefetch_skips_missing_files(self):
+        """Test that prefetch advises existing files and ignores missing ones"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            existing = os.path.join(tmpdir, "present.py")
+            with open(existing, 'w') as f:
+                f.write("x = 1\n")
+            
+            advised = io_backend.prefetch([existing, os.path.join(tmpdir, "missing.py")])
+            self.assertEqual(advised, 1 if io_backend.HAS_FADVISE else 0)
+
+
+class TestHtmlReport(unittest.TestCase):
+    """Test HTML report generation"""
+    
+    def test_report_escapes_source_derived_text(self):
+        """Test that names taken from source code cannot inject markup"""
+        analysis = AnalysisResult(
+            dependencies=[DependencyInfo("a.js", "<img src=x>", "import", 1, 0)],
+            complexity=[ComplexityInfo("<script>alert(1)</script>", "a.js", "O(n²)", 1)],
+            cycles=[],
+            metrics=ProjectMetrics(1, 1, "O(n²)", 1, 0)
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "report.html")
+            generate_html_report(analysis, output_path)
+            with open(output_path, encoding='utf-8') as f:
+                html = f.read()
+        
+        self.assertNotIn("<script>", html)
+        self.assertNotIn("<img", html)
+        self.assertIn("&lt;script&gt;alert(1)&lt;/script&gt;", html)
+        self.assertIn('<tr class="complexity-high">', html)
+        self.assertIn("No circular dependencies found!", html)
+
+
+class TestJsonOutput(unittest.TestCase):
+    """Test JSON serialization of analysis results"""
+    
+    output = {'complexity': [{'function': 'f', 'complexity': 'O(n²)', 'line': 3, 'warning': None}]}
+    
+    def test_stdlib_fallback_round_trips(self):
+        """Test that the json module fallback emits indented, decodable UTF-8"""
+        with mock.patch.object(codegraph, 'orjson', None):
+            fallback = codegraph._json_bytes(self.output)
+        
+        self.assertEqual(fallback, json.dumps(self.output, indent=2).encode('utf-8'))
+        self.assertEqual(json.loads(fallback), self.output)
+    
+    @unittest.skipUnless(codegraph.orjson, "orjson is not installed")
+    def test_orjson_matches_stdlib_fallback(self):
+        """Test that the orjson fast path decodes to the same data as the fallback"""
+        encoded = codegraph._json_bytes(self.output)
+        self.assertEqual(encoded, codegraph.orjson.dumps(self.output, option=codegraph.orjson.OPT_INDENT_2))
+        with mock.patch.object(codegraph, 'orjson', None):
+            fallback = codegraph._json_bytes(self.output)
+        
+        self.assertEqual(json.loads(encoded), json.loads(fallback))
 
 
 class TestComplexityAnalysis(unittest.TestCase):
@@ -363,6 +864,34 @@ def quadratic_function(items):
             complexity = result['complexity'][0]
             self.assertEqual(complexity['complexity'], 'O(n²)')
             os.unlink(f.name)
+        
+        # Test recursive async function
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write("""
+async def recursive_function(n):
+    if n <= 1:
+        return n
+    return await recursive_function(n - 1)
+""")
+            f.flush()
+            result = parser.parse(f.name)
+            complexity = result['complexity'][0]
+            self.assertEqual(complexity['complexity'], 'O(2^n)')
+            os.unlink(f.name)
+
+        # Test nested async for loops
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write("""
+async def pairs(rows, cols):
+    async for row in rows:
+        async for col in cols:
+            print(row, col)
+""")
+            f.flush()
+            result = parser.parse(f.name)
+            complexity = result['complexity'][0]
+            self.assertEqual(complexity['complexity'], 'O(n²)')
+            os.unlink(f.name)
 
 
 def run_tests():
@@ -376,7 +905,13 @@ def run_tests():
         TestJavaScriptParser,
         TestGoParser,
         TestDependencyGraphAnalyzer,
+        TestDependencyTable,
         TestCodeGraphAnalyzer,
+        TestAverageComplexity,
+        TestParseCache,
+        TestIoBackend,
+        TestHtmlReport,
+        TestJsonOutput,
         TestComplexityAnalysis
     ]
     